@@ -60,7 +60,9 @@ a = Analysis(
         'starlette.routing',
         'pydantic',
         'pydantic_core',
+        'pydantic_core._pydantic_core',
         'pydantic_settings',
+        'orjson',
         
         # Tortoise ORM
         'tortoise',
@@ -17,7 +17,7 @@ from .schemas import (
     UserLogin,
     UserLoginResponse
 )
-from .helpers import user_to_response
+from .helpers import list_json_response, user_to_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -118,7 +118,7 @@ async def get_all_users():
     Note: In production, this should be restricted to primary users only.
     """
     users = await User.all()
-    return [user_to_response(user) for user in users]
+    return list_json_response(UserResponse, [user_to_response(user) for user in users])
 
 
 @router.get("/users/{user_id}", response_model=UserResponse)
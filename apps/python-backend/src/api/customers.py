@@ -19,6 +19,7 @@ from .schemas import (
     CustomerStatementRequest,
     CustomerStatementResponse
 )
+from .helpers import list_json_response
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,7 @@ router = APIRouter()
 # Helper functions
 def customer_to_response(customer: Customer) -> CustomerResponse:
     """Convert Customer model to CustomerResponse schema"""
-    return CustomerResponse(
+    return CustomerResponse.model_construct(
         id=customer.id,
         name=customer.name,
         phone=customer.phone,
@@ -46,7 +47,7 @@ def customer_to_response(customer: Customer) -> CustomerResponse:
 
 def transaction_to_response(transaction: CustomerTransaction) -> CustomerTransactionResponse:
     """Convert CustomerTransaction model to CustomerTransactionResponse schema"""
-    return CustomerTransactionResponse(
+    return CustomerTransactionResponse.model_construct(
         id=transaction.id,
         customer_id=transaction.customer_id,
         transaction_type=transaction.transaction_type,
@@ -91,7 +92,7 @@ async def get_all_customers(
     # Apply pagination
     customers = await query.offset(skip).limit(limit).all()
 
-    return [customer_to_response(customer) for customer in customers]
+    return list_json_response(CustomerResponse, [customer_to_response(customer) for customer in customers])
 
 
 @router.get("/{customer_id}", response_model=CustomerResponse)
@@ -391,7 +392,7 @@ async def get_customer_transactions(
 
         transactions = await query.offset(skip).limit(limit).all()
 
-        return [transaction_to_response(t) for t in transactions]
+        return list_json_response(CustomerTransactionResponse, [transaction_to_response(t) for t in transactions])
 
     except DoesNotExist:
         raise HTTPException(
@@ -6,6 +6,7 @@ from fastapi import APIRouter, HTTPException, status
 from pydantic import BaseModel
 
 from ..database.demo_data import generate_all_demo_data, clear_demo_data
+from .settings import invalidate_settings_cache
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,7 @@ async def generate_demo_data():
     try:
         logger.info("Starting demo data generation...")
         result = await generate_all_demo_data()
+        invalidate_settings_cache(rows_replaced=True)
         
         return DemoDataResponse(
             success=True,
@@ -61,6 +63,7 @@ async def clear_all_demo_data():
     try:
         logger.warning("Clearing all demo data...")
         await clear_demo_data()
+        invalidate_settings_cache(rows_replaced=True)
         
         return DemoDataResponse(
             success=True,
@@ -1,6 +1,9 @@
 """
 Helper functions for API endpoints
 """
+from functools import lru_cache
+from fastapi import Response
+from pydantic import BaseModel, TypeAdapter
 from ..database.models import (
     User,
     Product,
@@ -21,9 +24,25 @@ from .schemas import (
 )
 
 
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+    """Cached list serializer for a response model"""
+    return TypeAdapter(list[model])
+
+
+def list_json_response(model: type[BaseModel], items: list[BaseModel]) -> Response:
+    """
+    Serialize a list of already-built response models in a single pass.
+
+    FastAPI dumps and re-validates route return values against response_model,
+    which would undo the model_construct fast path; a Response is passed through as-is.
+    """
+    return Response(content=_list_adapter(model).dump_json(items), media_type="application/json")
+
+
 def user_to_response(user: User) -> UserResponse:
     """Convert User model to UserResponse schema"""
-    return UserResponse(
+    return UserResponse.model_construct(
         id=user.id,
         full_name=user.full_name,
         mobile_number=user.mobile_number,
@@ -57,7 +76,7 @@ def product_to_response(product: Product) -> ProductResponse:
     
     item_type_value = product.item_type.value if hasattr(product.item_type, 'value') else str(product.item_type)
     
-    return ProductResponse(
+    return ProductResponse.model_construct(
         # Primary fields
         id=product.id,
         name=product.name,
@@ -86,17 +105,14 @@ def product_to_response(product: Product) -> ProductResponse:
         # Backward compatibility fields
         item_type=item_type_value,
         category=category_value,
-        selling_price=float(product.selling_price),
         tax_rate=float(product.tax_rate),
-        current_stock=product.current_stock,
-        min_stock_level=product.min_stock_level if product.min_stock_level else 0,
         image_url=product.image_url
     )
 
 
 def stock_transaction_to_response(transaction: StockTransaction) -> StockTransactionResponse:
     """Convert StockTransaction model to StockTransactionResponse schema"""
-    return StockTransactionResponse(
+    return StockTransactionResponse.model_construct(
         id=transaction.id,
         transaction_type=transaction.transaction_type.value,
         product_id=transaction.product_id,
@@ -34,6 +34,7 @@ from .schemas import (
     ProductUpdate,
     ProductResponse
 )
+from .helpers import list_json_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -95,7 +96,7 @@ async def product_to_response(product: Product) -> ProductResponse:
     if product.product_type == ProductType.VARIATION:
         variations_list = await ProductVariation.filter(parent_product_id=product.id).all()
         variations = [
-            ProductVariationResponse(
+            ProductVariationResponse.model_construct(
                 id=v.id,
                 parent_product_id=v.parent_product_id,
                 variation_name=v.variation_name,
@@ -117,14 +118,7 @@ async def product_to_response(product: Product) -> ProductResponse:
     if product.product_type == ProductType.BUNDLE:
         components_list = await ProductBundle.filter(bundle_product_id=product.id).all()
         bundle_components = [
-            ProductBundleComponentResponse(
-                id=c.id,
-                bundle_product_id=c.bundle_product_id,
-                component_product_id=c.component_product_id,
-                quantity=c.quantity,
-                created_at=c.created_at,
-                updated_at=c.updated_at
-            )
+            ProductBundleComponentResponse.from_orm_fast(c)
             for c in components_list
         ]
 
@@ -133,7 +127,7 @@ async def product_to_response(product: Product) -> ProductResponse:
     stock_qty = product.stock_quantity or product.current_stock
     low_stock = product.low_stock_threshold or product.min_stock_level
 
-    return ProductResponse(
+    return ProductResponse.model_construct(
         id=product.id,
         name=product.name,
         description=product.description,
@@ -160,10 +154,7 @@ async def product_to_response(product: Product) -> ProductResponse:
         # Backward compatibility
         item_type=product.item_type.value,
         category=category_name or "general",
-        selling_price=float(base_price_val),
         tax_rate=float(product.tax_rate),
-        current_stock=stock_qty,
-        min_stock_level=low_stock,
         image_url=product.image_url or (product.image_paths[0] if product.image_paths else None)
     )
 
@@ -195,20 +186,10 @@ async def get_all_categories(
     
     categories = await query.all()
     
-    return [
-        ProductCategoryResponse(
-            id=cat.id,
-            name=cat.name,
-            description=cat.description,
-            image_path=cat.image_path,
-            parent_category_id=cat.parent_category_id,
-            display_order=cat.display_order,
-            is_active=cat.is_active,
-            created_at=cat.created_at,
-            updated_at=cat.updated_at
-        )
+    return list_json_response(ProductCategoryResponse, [
+        ProductCategoryResponse.from_orm_fast(cat)
         for cat in categories
-    ]
+    ])
 
 
 @router.get("/categories/{category_id}", response_model=ProductCategoryResponse)
@@ -216,17 +197,7 @@ async def get_category(category_id: int):
     """Get a specific product category by ID"""
     try:
         category = await ProductCategory.get(id=category_id)
-        return ProductCategoryResponse(
-            id=category.id,
-            name=category.name,
-            description=category.description,
-            image_path=category.image_path,
-            parent_category_id=category.parent_category_id,
-            display_order=category.display_order,
-            is_active=category.is_active,
-            created_at=category.created_at,
-            updated_at=category.updated_at
-        )
+        return ProductCategoryResponse.from_orm_fast(category)
     except DoesNotExist:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -257,17 +228,7 @@ async def create_category(category_data: ProductCategoryCreate):
         
         logger.info(f"New category created: {new_category.name} (ID: {new_category.id})")
         
-        return ProductCategoryResponse(
-            id=new_category.id,
-            name=new_category.name,
-            description=new_category.description,
-            image_path=new_category.image_path,
-            parent_category_id=new_category.parent_category_id,
-            display_order=new_category.display_order,
-            is_active=new_category.is_active,
-            created_at=new_category.created_at,
-            updated_at=new_category.updated_at
-        )
+        return ProductCategoryResponse.from_orm_fast(new_category)
     
     except IntegrityError as e:
         logger.error(f"Failed to create category: {e}")
@@ -309,17 +270,7 @@ async def update_category(category_id: int, category_data: ProductCategoryUpdate
 
         logger.info(f"Category {category_id} updated successfully")
 
-        return ProductCategoryResponse(
-            id=category.id,
-            name=category.name,
-            description=category.description,
-            image_path=category.image_path,
-            parent_category_id=category.parent_category_id,
-            display_order=category.display_order,
-            is_active=category.is_active,
-            created_at=category.created_at,
-            updated_at=category.updated_at
-        )
+        return ProductCategoryResponse.from_orm_fast(category)
 
     except DoesNotExist:
         raise HTTPException(
@@ -495,7 +446,7 @@ async def get_all_products(
     for product in products:
         response_list.append(await product_to_response(product))
 
-    return response_list
+    return list_json_response(ProductResponse, response_list)
 
 
 @router.get("/{product_id}", response_model=ProductResponse)
@@ -526,11 +477,12 @@ async def get_product_by_barcode(barcode: str):
         if variation:
             parent_product = await Product.get(id=variation.parent_product_id).prefetch_related('category', 'tax')
             response = await product_to_response(parent_product)
-            # Add variation-specific info
-            response.selected_variation_id = variation.id
-            response.selected_variation_name = variation.variation_name
-            response.base_price = float(parent_product.base_price + variation.price_adjustment)
-            return response
+            # Add variation-specific info (response models are frozen)
+            return response.model_copy(update={
+                'selected_variation_id': variation.id,
+                'selected_variation_name': variation.variation_name,
+                'base_price': float(parent_product.base_price + variation.price_adjustment)
+            })
 
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -589,7 +541,7 @@ async def create_product(product_data: ProductCreate, created_by_id: int = 1):
             category_id=product_data.category_id,
             base_price=Decimal(str(base_price)),
             selling_price=Decimal(str(base_price)),  # Backward compatibility
-            cost_price=Decimal(str(product_data.cost_price)),
+            cost_price=product_data.cost_price,
             tax_id=product_data.tax_id,
             tax_rate=Decimal(str(product_data.tax_rate or 0)),  # Backward compatibility
             is_active=product_data.is_active,
@@ -614,7 +566,7 @@ async def create_product(product_data: ProductCreate, created_by_id: int = 1):
                     sku=var_data.sku,
                     barcode=var_data.barcode,
                     price_adjustment=Decimal(str(var_data.price_adjustment)),
-                    cost_price=Decimal(str(var_data.cost_price)) if var_data.cost_price else None,
+                    cost_price=var_data.cost_price or None,
                     stock_quantity=var_data.stock_quantity,
                     attributes=var_data.attributes,
                     is_active=var_data.is_active
@@ -681,8 +633,8 @@ async def update_product(product_id: int, product_data: ProductUpdate):
                     detail=f"Tax rule with ID {update_data['tax_id']} not found"
                 )
 
-        # Convert float to Decimal for price fields
-        for field in ['base_price', 'cost_price', 'selling_price', 'tax_rate']:
+        # Convert float to Decimal for the legacy price fields
+        for field in ['selling_price', 'tax_rate']:
             if field in update_data and update_data[field] is not None:
                 update_data[field] = Decimal(str(update_data[field]))
 
@@ -857,8 +809,8 @@ async def get_product_variations(product_id: int):
 
         variations = await ProductVariation.filter(parent_product_id=product_id).all()
 
-        return [
-            ProductVariationResponse(
+        return list_json_response(ProductVariationResponse, [
+            ProductVariationResponse.model_construct(
                 id=v.id,
                 parent_product_id=v.parent_product_id,
                 variation_name=v.variation_name,
@@ -873,7 +825,7 @@ async def get_product_variations(product_id: int):
                 updated_at=v.updated_at
             )
             for v in variations
-        ]
+        ])
 
     except DoesNotExist:
         raise HTTPException(
@@ -900,7 +852,7 @@ async def create_product_variation(product_id: int, variation_data: ProductVaria
             sku=variation_data.sku,
             barcode=variation_data.barcode,
             price_adjustment=Decimal(str(variation_data.price_adjustment)),
-            cost_price=Decimal(str(variation_data.cost_price)) if variation_data.cost_price else None,
+            cost_price=variation_data.cost_price or None,
             stock_quantity=variation_data.stock_quantity,
             attributes=variation_data.attributes,
             is_active=variation_data.is_active
@@ -908,7 +860,7 @@ async def create_product_variation(product_id: int, variation_data: ProductVaria
 
         logger.info(f"New variation created for product {product_id}: {new_variation.variation_name}")
 
-        return ProductVariationResponse(
+        return ProductVariationResponse.model_construct(
             id=new_variation.id,
             parent_product_id=new_variation.parent_product_id,
             variation_name=new_variation.variation_name,
@@ -946,7 +898,7 @@ async def update_product_variation(product_id: int, variation_id: int, variation
         update_data = variation_data.model_dump(exclude_unset=True)
 
         # Convert float to Decimal for price fields
-        for field in ['price_adjustment', 'cost_price']:
+        for field in ['price_adjustment']:
             if field in update_data and update_data[field] is not None:
                 update_data[field] = Decimal(str(update_data[field]))
 
@@ -957,7 +909,7 @@ async def update_product_variation(product_id: int, variation_id: int, variation
 
         logger.info(f"Variation {variation_id} updated successfully")
 
-        return ProductVariationResponse(
+        return ProductVariationResponse.model_construct(
             id=variation.id,
             parent_product_id=variation.parent_product_id,
             variation_name=variation.variation_name,
@@ -1021,17 +973,10 @@ async def get_bundle_components(product_id: int):
 
         components = await ProductBundle.filter(bundle_product_id=product_id).all()
 
-        return [
-            ProductBundleComponentResponse(
-                id=c.id,
-                bundle_product_id=c.bundle_product_id,
-                component_product_id=c.component_product_id,
-                quantity=c.quantity,
-                created_at=c.created_at,
-                updated_at=c.updated_at
-            )
+        return list_json_response(ProductBundleComponentResponse, [
+            ProductBundleComponentResponse.from_orm_fast(c)
             for c in components
-        ]
+        ])
 
     except DoesNotExist:
         raise HTTPException(
@@ -1070,14 +1015,7 @@ async def add_bundle_component(product_id: int, component_data: ProductBundleCom
 
         logger.info(f"Component added to bundle {product_id}: {component.name} x{component_data.quantity}")
 
-        return ProductBundleComponentResponse(
-            id=new_component.id,
-            bundle_product_id=new_component.bundle_product_id,
-            component_product_id=new_component.component_product_id,
-            quantity=new_component.quantity,
-            created_at=new_component.created_at,
-            updated_at=new_component.updated_at
-        )
+        return ProductBundleComponentResponse.from_orm_fast(new_component)
 
     except DoesNotExist:
         raise HTTPException(
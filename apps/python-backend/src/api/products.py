@@ -25,7 +25,7 @@ from .schemas import (
     StockAdjustmentResponse,
     StockAdjustmentLineResponse
 )
-from .helpers import product_to_response, stock_transaction_to_response
+from .helpers import list_json_response, product_to_response, stock_transaction_to_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -70,7 +70,7 @@ async def create_stock_transaction(transaction_data: StockTransactionCreate, per
 
         # Calculate total cost
         unit_cost = transaction_data.unit_cost if transaction_data.unit_cost is not None else product.cost_price
-        total_cost = Decimal(str(unit_cost)) * abs(transaction_data.quantity)
+        total_cost = unit_cost * abs(transaction_data.quantity)
 
         # Create transaction
         transaction = await StockTransaction.create(
@@ -79,7 +79,7 @@ async def create_stock_transaction(transaction_data: StockTransactionCreate, per
             quantity=transaction_data.quantity,
             stock_before=stock_before,
             stock_after=stock_after,
-            unit_cost=Decimal(str(unit_cost)),
+            unit_cost=unit_cost,
             total_cost=total_cost,
             reference_number=transaction_data.reference_number,
             notes=transaction_data.notes,
@@ -151,7 +151,7 @@ async def get_stock_transactions(
 
     transactions = await query.order_by('-created_at').offset(skip).limit(limit).all()
 
-    return [stock_transaction_to_response(t) for t in transactions]
+    return list_json_response(StockTransactionResponse, [stock_transaction_to_response(t) for t in transactions])
 
 
 # ============================================================================
@@ -223,7 +223,7 @@ async def create_stock_adjustment(adjustment_data: StockAdjustmentCreate, perfor
         # Fetch the adjustment with lines for response
         adjustment_with_lines = await StockAdjustment.get(id=adjustment.id).prefetch_related('lines')
 
-        return StockAdjustmentResponse(
+        return StockAdjustmentResponse.model_construct(
             id=adjustment_with_lines.id,
             adjustment_date=adjustment_with_lines.adjustment_date,
             reason=adjustment_with_lines.reason,
@@ -231,7 +231,7 @@ async def create_stock_adjustment(adjustment_data: StockAdjustmentCreate, perfor
             is_completed=adjustment_with_lines.is_completed,
             created_at=adjustment_with_lines.created_at,
             lines=[
-                StockAdjustmentLineResponse(
+                StockAdjustmentLineResponse.model_construct(
                     id=line.id,
                     product_id=line.product_id,
                     expected_quantity=line.expected_quantity,
@@ -264,7 +264,7 @@ async def get_stock_adjustments(
     for adjustment in adjustments:
         lines = await StockAdjustmentLine.filter(adjustment_id=adjustment.id).all()
 
-        result.append(StockAdjustmentResponse(
+        result.append(StockAdjustmentResponse.model_construct(
             id=adjustment.id,
             adjustment_date=adjustment.adjustment_date,
             reason=adjustment.reason,
@@ -272,7 +272,7 @@ async def get_stock_adjustments(
             is_completed=adjustment.is_completed,
             created_at=adjustment.created_at,
             lines=[
-                StockAdjustmentLineResponse(
+                StockAdjustmentLineResponse.model_construct(
                     id=line.id,
                     product_id=line.product_id,
                     expected_quantity=line.expected_quantity,
@@ -334,7 +334,7 @@ async def get_all_products(
     # Apply pagination
     products = await query.offset(skip).limit(limit).all()
 
-    return [product_to_response(product) for product in products]
+    return list_json_response(ProductResponse, [product_to_response(product) for product in products])
 
 
 @router.post("/", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
@@ -356,7 +356,7 @@ async def create_product(product_data: ProductCreate, created_by_id: int = 1):
             description=product_data.description,
             item_type=product_data.item_type,
             category=product_data.category,
-            cost_price=Decimal(str(product_data.cost_price)),
+            cost_price=product_data.cost_price,
             selling_price=Decimal(str(product_data.selling_price)),
             tax_rate=Decimal(str(product_data.tax_rate)),
             track_inventory=product_data.track_inventory,
@@ -408,8 +408,8 @@ async def update_product(product_id: int, product_data: ProductUpdate):
         # Update only provided fields
         update_data = product_data.model_dump(exclude_unset=True)
 
-        # Convert float to Decimal for price fields
-        for field in ['cost_price', 'selling_price', 'tax_rate']:
+        # Convert float to Decimal for the legacy price fields
+        for field in ['selling_price', 'tax_rate']:
             if field in update_data and update_data[field] is not None:
                 update_data[field] = Decimal(str(update_data[field]))
 
@@ -489,7 +489,7 @@ async def get_low_stock_products(
                 if percentage <= threshold:
                     low_stock_products.append(product)
     
-    return [product_to_response(p) for p in low_stock_products]
+    return list_json_response(ProductResponse, [product_to_response(p) for p in low_stock_products])
 
 
 @router.get("/inventory/out-of-stock", response_model=List[ProductResponse])
@@ -501,7 +501,7 @@ async def get_out_of_stock_products():
         current_stock=0
     ).all()
     
-    return [product_to_response(p) for p in products]
+    return list_json_response(ProductResponse, [product_to_response(p) for p in products])
 
 
 @router.get("/inventory/valuation")
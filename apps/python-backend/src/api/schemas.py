@@ -1,98 +1,111 @@
 """
 Pydantic schemas for API request/response validation
 """
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
-from typing import Optional, Any, Dict, List
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Any, ClassVar, Literal
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, StringConstraints, computed_field
+from pydantic.dataclasses import dataclass
+
+
+# Shared field types
+PinStr = Annotated[str, StringConstraints(min_length=6, max_length=6, pattern=r'^\d{6}$')]
+# Opaque JSON blobs stored as-is in JSONFields; not walked key by key
+JsonObject = Annotated[dict[str, Any], SkipValidation]
+# A single typed setting value (see SettingDataType); smart-union picks the exact JSON type
+SettingValue = bool | int | float | str | list[Any] | dict[str, Any] | None
+# Matches the DecimalField(max_digits=10, decimal_places=2) price columns
+Money = Annotated[Decimal, Field(ge=0, max_digits=10, decimal_places=2)]
+NonNegInt = Annotated[int, Field(ge=0)]
+Percent = Annotated[float, Field(ge=0, le=100)]
+Str100 = Annotated[str, StringConstraints(max_length=100)]
+Str255 = Annotated[str, StringConstraints(max_length=255)]
+# Mobile/phone numbers; matches the CharField(max_length=20) columns
+PhoneStr = Annotated[str, StringConstraints(max_length=20)]
+
+# Categorical string fields (values mirror the database enums)
+ProductType = Literal['simple', 'bundle', 'variation', 'service']
+StockTransactionType = Literal['purchase', 'sale', 'adjustment', 'return', 'damage', 'transfer']
+CashTransactionType = Literal['cash_in', 'cash_out', 'opening_balance', 'closing_balance']
+TaxType = Literal['simple', 'gst_cgst', 'gst_sgst', 'gst_igst', 'cess', 'vat', 'custom']
+TaxCalculationMethod = Literal['percentage', 'fixed_amount']
+TaxInclusionType = Literal['exclusive', 'inclusive']
+RoundingMethod = Literal['round_half_up', 'round_up', 'round_down', 'no_rounding']
+BackupType = Literal['full', 'incremental', 'selective']
+ScheduleType = Literal['interval', 'daily', 'weekly', 'monthly']
+
+
+class ORMResponse(BaseModel):
+    """Base schema for responses built from already-validated ORM rows"""
+    model_config = ConfigDict(frozen=True, extra='ignore', from_attributes=True)
+
+    __orm_fields__: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__orm_fields__ = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """Build the response from an ORM object without re-running validation"""
+        return cls.model_construct(**{f: getattr(obj, f) for f in cls.__orm_fields__})
 
 
 # User Schemas
 class UserCreate(BaseModel):
     """Schema for creating a new user"""
     full_name: str = Field(..., min_length=1, max_length=255)
-    mobile_number: Optional[str] = Field(None, max_length=20)
-    pin: str = Field(..., min_length=6, max_length=6, pattern=r'^\d{6}$')
-    email: Optional[str] = Field(None, max_length=255)
-    avatar_color: Optional[str] = Field(None, max_length=50)
-    notes: Optional[str] = None
-
-    @field_validator('pin')
-    @classmethod
-    def validate_pin(cls, v: str) -> str:
-        """Validate PIN is numeric and exactly 6 digits"""
-        if not v.isdigit():
-            raise ValueError('PIN must contain only digits')
-        if len(v) != 6:
-            raise ValueError('PIN must be exactly 6 digits')
-        return v
+    mobile_number: PhoneStr | None = None
+    pin: PinStr
+    email: Str255 | None = None
+    avatar_color: str | None = Field(None, max_length=50)
+    notes: str | None = None
 
 
 class UserUpdate(BaseModel):
     """Schema for updating a user"""
-    full_name: Optional[str] = Field(None, min_length=1, max_length=255)
-    mobile_number: Optional[str] = Field(None, max_length=20)
-    email: Optional[str] = Field(None, max_length=255)
-    avatar_color: Optional[str] = Field(None, max_length=50)
-    notes: Optional[str] = None
-    is_active: Optional[bool] = None
+    full_name: str | None = Field(None, min_length=1, max_length=255)
+    mobile_number: PhoneStr | None = None
+    email: Str255 | None = None
+    avatar_color: str | None = Field(None, max_length=50)
+    notes: str | None = None
+    is_active: bool | None = None
 
 
 class UserChangePIN(BaseModel):
     """Schema for changing user PIN"""
-    old_pin: str = Field(..., min_length=6, max_length=6)
-    new_pin: str = Field(..., min_length=6, max_length=6, pattern=r'^\d{6}$')
-
-    @field_validator('new_pin')
-    @classmethod
-    def validate_new_pin(cls, v: str) -> str:
-        """Validate new PIN is numeric and exactly 6 digits"""
-        if not v.isdigit():
-            raise ValueError('PIN must contain only digits')
-        if len(v) != 6:
-            raise ValueError('PIN must be exactly 6 digits')
-        return v
+    old_pin: PinStr
+    new_pin: PinStr
 
 
-class UserResponse(BaseModel):
+class UserResponse(ORMResponse):
     """Schema for user response"""
     id: int
     full_name: str
-    mobile_number: Optional[str]
-    email: Optional[str]
-    avatar_color: Optional[str]
+    mobile_number: str | None = None
+    email: str | None = None
+    avatar_color: str | None = None
     role: str
     is_active: bool
-    notes: Optional[str]
-    last_login: Optional[datetime]
+    notes: str | None = None
+    last_login: datetime | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class UserLogin(BaseModel):
     """Schema for user login"""
-    pin: str = Field(..., min_length=6, max_length=6, pattern=r'^\d{6}$')
-
-    @field_validator('pin')
-    @classmethod
-    def validate_pin(cls, v: str) -> str:
-        """Validate PIN is numeric and exactly 6 digits"""
-        if not v.isdigit():
-            raise ValueError('PIN must contain only digits')
-        if len(v) != 6:
-            raise ValueError('PIN must be exactly 6 digits')
-        return v
+    pin: PinStr
 
 
-class UserLoginResponse(BaseModel):
+@dataclass(slots=True, frozen=True)
+class UserLoginResponse:
     """Schema for login response"""
     success: bool
     message: str
-    user: Optional[UserResponse] = None
-    token: Optional[str] = None  # For future JWT implementation
+    user: UserResponse | None = None
+    token: str | None = None  # For future JWT implementation
 
 
 # ============================================================================
@@ -102,28 +115,28 @@ class UserLoginResponse(BaseModel):
 class CustomerCreate(BaseModel):
     """Schema for creating a new customer"""
     name: str = Field(..., min_length=1, max_length=255)
-    phone: Optional[str] = Field(None, max_length=20)
-    email: Optional[str] = Field(None, max_length=255)
-    address: Optional[str] = None
-    loyalty_points: int = Field(default=0, ge=0)
+    phone: PhoneStr | None = None
+    email: Str255 | None = None
+    address: str | None = None
+    loyalty_points: NonNegInt = 0
 
 
 class CustomerUpdate(BaseModel):
     """Schema for updating a customer"""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
-    phone: Optional[str] = Field(None, max_length=20)
-    email: Optional[str] = Field(None, max_length=255)
-    address: Optional[str] = None
-    loyalty_points: Optional[int] = Field(None, ge=0)
+    name: str | None = Field(None, min_length=1, max_length=255)
+    phone: PhoneStr | None = None
+    email: Str255 | None = None
+    address: str | None = None
+    loyalty_points: NonNegInt | None = None
 
 
-class CustomerResponse(BaseModel):
+class CustomerResponse(ORMResponse):
     """Schema for customer response"""
     id: int
     name: str
-    phone: Optional[str]
-    email: Optional[str]
-    address: Optional[str]
+    phone: str | None = None
+    email: str | None = None
+    address: str | None = None
     loyalty_points: int
     credit_limit: float
     credit_balance: float
@@ -131,24 +144,21 @@ class CustomerResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class CustomerCreditOperation(BaseModel):
     """Schema for customer credit operations (add credit/payment)"""
     amount: float = Field(..., gt=0, description="Amount to add or pay")
-    reference_number: Optional[str] = Field(None, max_length=100)
-    notes: Optional[str] = None
+    reference_number: Str100 | None = None
+    notes: str | None = None
 
 
 class CustomerLoyaltyOperation(BaseModel):
     """Schema for loyalty point operations"""
     points: int = Field(..., description="Points to add (positive) or redeem (negative)")
-    notes: Optional[str] = None
+    notes: str | None = None
 
 
-class CustomerTransactionResponse(BaseModel):
+class CustomerTransactionResponse(ORMResponse):
     """Schema for customer transaction response"""
     id: int
     customer_id: int
@@ -159,30 +169,29 @@ class CustomerTransactionResponse(BaseModel):
     balance_after: float
     loyalty_points_before: int
     loyalty_points_after: int
-    reference_number: Optional[str]
-    notes: Optional[str]
+    reference_number: str | None = None
+    notes: str | None = None
     created_at: datetime
-    created_by_id: Optional[int]
-
-    class Config:
-        from_attributes = True
+    created_by_id: int | None = None
 
 
 class CustomerStatementRequest(BaseModel):
     """Schema for customer statement request"""
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
 
 
-class CustomerStatementResponse(BaseModel):
+class CustomerStatementResponse(ORMResponse):
     """Schema for customer statement response"""
+    model_config = ConfigDict(defer_build=True)
+
     customer: CustomerResponse
-    transactions: List['CustomerTransactionResponse']
+    transactions: list[CustomerTransactionResponse]
     opening_balance: float
     closing_balance: float
     total_credits: float
     total_payments: float
-    statement_period: Dict[str, Optional[datetime]]
+    statement_period: dict[str, datetime | None]
 
 
 # ============================================================================
@@ -192,28 +201,25 @@ class CustomerStatementResponse(BaseModel):
 class UserActivityLogCreate(BaseModel):
     """Schema for creating a user activity log"""
     activity_type: str = Field(..., max_length=50)
-    description: Optional[str] = None
-    session_id: Optional[str] = Field(None, max_length=100)
-    ip_address: Optional[str] = Field(None, max_length=45)
-    duration_ms: Optional[int] = None
-    metadata: Optional[Dict[str, Any]] = None
+    description: str | None = None
+    session_id: Str100 | None = None
+    ip_address: str | None = Field(None, max_length=45)
+    duration_ms: int | None = None
+    metadata: JsonObject | None = None
 
 
-class UserActivityLogResponse(BaseModel):
+class UserActivityLogResponse(ORMResponse):
     """Schema for user activity log response"""
     id: int
     user_id: int
     activity_type: str
-    description: Optional[str]
-    session_id: Optional[str]
-    ip_address: Optional[str]
-    duration_ms: Optional[int]
-    metadata: Optional[Dict[str, Any]]
+    description: str | None = None
+    session_id: str | None = None
+    ip_address: str | None = None
+    duration_ms: int | None = None
+    metadata: JsonObject | None = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class UserPerformanceMetrics(BaseModel):
     """Schema for user performance metrics"""
@@ -224,7 +230,7 @@ class UserPerformanceMetrics(BaseModel):
     total_revenue: float
     average_transaction_value: float
     login_count: int
-    last_login: Optional[datetime]
+    last_login: datetime | None
     period_start: datetime
     period_end: datetime
 
@@ -236,36 +242,33 @@ class UserPerformanceMetrics(BaseModel):
 class ProductCategoryCreate(BaseModel):
     """Schema for creating a product category"""
     name: str = Field(..., min_length=1, max_length=255)
-    description: Optional[str] = None
-    parent_category_id: Optional[int] = None
+    description: str | None = None
+    parent_category_id: int | None = None
     display_order: int = Field(default=0)
     is_active: bool = Field(default=True)
 
 
 class ProductCategoryUpdate(BaseModel):
     """Schema for updating a product category"""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
-    description: Optional[str] = None
-    parent_category_id: Optional[int] = None
-    display_order: Optional[int] = None
-    is_active: Optional[bool] = None
+    name: str | None = Field(None, min_length=1, max_length=255)
+    description: str | None = None
+    parent_category_id: int | None = None
+    display_order: int | None = None
+    is_active: bool | None = None
 
 
-class ProductCategoryResponse(BaseModel):
+class ProductCategoryResponse(ORMResponse):
     """Schema for product category response"""
     id: int
     name: str
-    description: Optional[str]
-    image_path: Optional[str]
-    parent_category_id: Optional[int]
+    description: str | None = None
+    image_path: str | None = None
+    parent_category_id: int | None = None
     display_order: int
     is_active: bool
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ============================================================================
 # Product Variation Schemas
@@ -274,57 +277,55 @@ class ProductCategoryResponse(BaseModel):
 class ProductVariationCreate(BaseModel):
     """Schema for creating a product variation"""
     variation_name: str = Field(..., min_length=1, max_length=255)
-    sku: Optional[str] = Field(None, max_length=100)
-    barcode: Optional[str] = Field(None, max_length=100)
+    sku: Str100 | None = None
+    barcode: Str100 | None = None
     price_adjustment: float = Field(default=0)
-    cost_price: Optional[float] = Field(None, ge=0)
-    stock_quantity: int = Field(default=0, ge=0)
-    attributes: Dict[str, Any] = Field(default_factory=dict)
+    cost_price: Money | None = None
+    stock_quantity: NonNegInt = 0
+    attributes: JsonObject = Field(default_factory=dict)
     is_active: bool = Field(default=True)
 
 
 class ProductVariationUpdate(BaseModel):
     """Schema for updating a product variation"""
-    variation_name: Optional[str] = Field(None, min_length=1, max_length=255)
-    sku: Optional[str] = Field(None, max_length=100)
-    barcode: Optional[str] = Field(None, max_length=100)
-    price_adjustment: Optional[float] = None
-    cost_price: Optional[float] = Field(None, ge=0)
-    stock_quantity: Optional[int] = Field(None, ge=0)
-    attributes: Optional[Dict[str, Any]] = None
-    is_active: Optional[bool] = None
+    variation_name: str | None = Field(None, min_length=1, max_length=255)
+    sku: Str100 | None = None
+    barcode: Str100 | None = None
+    price_adjustment: float | None = None
+    cost_price: Money | None = None
+    stock_quantity: NonNegInt | None = None
+    attributes: JsonObject | None = None
+    is_active: bool | None = None
 
 
-class ProductVariationResponse(BaseModel):
+class ProductVariationResponse(ORMResponse):
     """Schema for product variation response"""
     id: int
     parent_product_id: int
     variation_name: str
-    sku: Optional[str]
-    barcode: Optional[str]
+    sku: str | None = None
+    barcode: str | None = None
     price_adjustment: float
-    cost_price: Optional[float]
+    cost_price: float | None = None
     stock_quantity: int
-    attributes: Dict[str, Any]
+    attributes: JsonObject
     is_active: bool
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ============================================================================
 # Product Bundle Schemas
 # ============================================================================
 
-class ProductBundleComponentCreate(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ProductBundleComponentCreate:
     """Schema for creating a bundle component"""
     component_product_id: int
     quantity: int = Field(..., ge=1)
 
 
-class ProductBundleComponentResponse(BaseModel):
+class ProductBundleComponentResponse(ORMResponse):
     """Schema for bundle component response"""
     id: int
     bundle_product_id: int
@@ -333,9 +334,6 @@ class ProductBundleComponentResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ============================================================================
 # Enhanced Product Schemas
@@ -344,121 +342,137 @@ class ProductBundleComponentResponse(BaseModel):
 class ProductCreate(BaseModel):
     """Schema for creating a new product"""
     name: str = Field(..., min_length=1, max_length=255)
-    description: Optional[str] = None
-    sku: Optional[str] = Field(None, max_length=100)
-    barcode: Optional[str] = Field(None, max_length=100)
-    product_type: str = Field(default="simple")  # simple/bundle/variation/service
-    category_id: Optional[int] = None
-    base_price: float = Field(..., ge=0)
-    cost_price: float = Field(default=0, ge=0)
-    tax_id: Optional[int] = None
+    description: str | None = None
+    sku: Str100 | None = None
+    barcode: Str100 | None = None
+    product_type: ProductType = "simple"
+    category_id: int | None = None
+    base_price: Money
+    cost_price: Money = 0
+    tax_id: int | None = None
     is_active: bool = Field(default=True)
     track_inventory: bool = Field(default=True)
-    stock_quantity: int = Field(default=0, ge=0)
-    low_stock_threshold: int = Field(default=0, ge=0)
-    max_stock_level: int = Field(default=0, ge=0)
-    image_paths: List[str] = Field(default_factory=list)
-    notes: Optional[str] = None
+    stock_quantity: NonNegInt = 0
+    low_stock_threshold: NonNegInt = 0
+    max_stock_level: NonNegInt = 0
+    image_paths: list[str] = Field(default_factory=list)
+    notes: str | None = None
 
     # For VARIATION type products
-    variations: Optional[List[ProductVariationCreate]] = None
+    variations: list[ProductVariationCreate] | None = None
 
     # For BUNDLE type products
-    bundle_components: Optional[List[ProductBundleComponentCreate]] = None
+    bundle_components: list[ProductBundleComponentCreate] | None = None
 
     # Backward compatibility fields
-    item_type: Optional[str] = Field(default="product")
-    selling_price: Optional[float] = None
-    tax_rate: Optional[float] = None
-    current_stock: Optional[int] = None
-    min_stock_level: Optional[int] = None
-    image_url: Optional[str] = None
+    item_type: str | None = Field(default="product")
+    selling_price: float | None = None
+    tax_rate: float | None = None
+    current_stock: int | None = None
+    min_stock_level: int | None = None
+    image_url: str | None = None
 
 
 class ProductUpdate(BaseModel):
     """Schema for updating a product"""
-    name: Optional[str] = Field(None, min_length=1, max_length=255)
-    description: Optional[str] = None
-    sku: Optional[str] = Field(None, max_length=100)
-    barcode: Optional[str] = Field(None, max_length=100)
-    product_type: Optional[str] = None
-    category_id: Optional[int] = None
-    base_price: Optional[float] = Field(None, ge=0)
-    cost_price: Optional[float] = Field(None, ge=0)
-    tax_id: Optional[int] = None
-    is_active: Optional[bool] = None
-    track_inventory: Optional[bool] = None
-    stock_quantity: Optional[int] = Field(None, ge=0)
-    low_stock_threshold: Optional[int] = Field(None, ge=0)
-    max_stock_level: Optional[int] = Field(None, ge=0)
-    image_paths: Optional[List[str]] = None
-    notes: Optional[str] = None
+    name: str | None = Field(None, min_length=1, max_length=255)
+    description: str | None = None
+    sku: Str100 | None = None
+    barcode: Str100 | None = None
+    product_type: ProductType | None = None
+    category_id: int | None = None
+    base_price: Money | None = None
+    cost_price: Money | None = None
+    tax_id: int | None = None
+    is_active: bool | None = None
+    track_inventory: bool | None = None
+    stock_quantity: NonNegInt | None = None
+    low_stock_threshold: NonNegInt | None = None
+    max_stock_level: NonNegInt | None = None
+    image_paths: list[str] | None = None
+    notes: str | None = None
 
     # Backward compatibility
-    item_type: Optional[str] = None
-    category: Optional[str] = None
-    selling_price: Optional[float] = None
-    tax_rate: Optional[float] = None
-    current_stock: Optional[int] = None
-    min_stock_level: Optional[int] = None
-    image_url: Optional[str] = None
+    item_type: str | None = None
+    category: str | None = None
+    selling_price: float | None = None
+    tax_rate: float | None = None
+    current_stock: int | None = None
+    min_stock_level: int | None = None
+    image_url: str | None = None
 
 
-class ProductResponse(BaseModel):
+class ProductResponse(ORMResponse):
     """Schema for product response"""
     id: int
     name: str
-    description: Optional[str]
-    sku: Optional[str]
-    barcode: Optional[str]
+    description: str | None = None
+    sku: str | None = None
+    barcode: str | None = None
     product_type: str
-    category_id: Optional[int]
-    category_name: Optional[str] = None
+    category_id: int | None = None
+    category_name: str | None = None
     base_price: float
     cost_price: float
-    tax_id: Optional[int]
-    tax_name: Optional[str] = None
+    tax_id: int | None = None
+    tax_name: str | None = None
     is_active: bool
     track_inventory: bool
     stock_quantity: int
     low_stock_threshold: int
     max_stock_level: int
-    image_paths: List[str]
-    notes: Optional[str]
+    image_paths: list[str]
+    notes: str | None = None
     created_at: datetime
     updated_at: datetime
 
     # Include variations if product_type = variation
-    variations: Optional[List[ProductVariationResponse]] = None
+    variations: list[ProductVariationResponse] | None = None
 
     # Include bundle components if product_type = bundle
-    bundle_components: Optional[List[ProductBundleComponentResponse]] = None
+    bundle_components: list[ProductBundleComponentResponse] | None = None
+
+    # Set when the product was looked up by one of its variations' barcodes
+    selected_variation_id: int | None = None
+    selected_variation_name: str | None = None
 
     # Backward compatibility fields
     item_type: str
     category: str
-    selling_price: float
     tax_rate: float
-    current_stock: int
-    min_stock_level: int
-    image_url: Optional[str]
+    image_url: str | None = None
+
+    @computed_field
+    @property
+    def selling_price(self) -> float:
+        """Legacy alias of base_price"""
+        return self.base_price
+
+    @computed_field
+    @property
+    def current_stock(self) -> int:
+        """Legacy alias of stock_quantity"""
+        return self.stock_quantity
 
-    class Config:
-        from_attributes = True
+    @computed_field
+    @property
+    def min_stock_level(self) -> int:
+        """Legacy alias of low_stock_threshold"""
+        return self.low_stock_threshold
 
 
 # Stock Transaction Schemas
 class StockTransactionCreate(BaseModel):
     """Schema for creating a stock transaction"""
     product_id: int
-    transaction_type: str
+    transaction_type: StockTransactionType
     quantity: int
-    unit_cost: Optional[float] = Field(None, ge=0)
-    reference_number: Optional[str] = Field(None, max_length=100)
-    notes: Optional[str] = None
+    unit_cost: Money | None = None
+    reference_number: Str100 | None = None
+    notes: str | None = None
 
 
-class StockTransactionResponse(BaseModel):
+class StockTransactionResponse(ORMResponse):
     """Schema for stock transaction response"""
     id: int
     transaction_type: str
@@ -466,62 +480,107 @@ class StockTransactionResponse(BaseModel):
     quantity: int
     stock_before: int
     stock_after: int
-    unit_cost: Optional[float]
-    total_cost: Optional[float]
-    reference_number: Optional[str]
-    notes: Optional[str]
+    unit_cost: float | None = None
+    total_cost: float | None = None
+    reference_number: str | None = None
+    notes: str | None = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Stock Adjustment Schemas
-class StockAdjustmentLineCreate(BaseModel):
+@dataclass(slots=True, frozen=True)
+class StockAdjustmentLineCreate:
     """Schema for stock adjustment line item"""
     product_id: int
     expected_quantity: int
     actual_quantity: int
-    notes: Optional[str] = None
+    notes: str | None = None
 
 
 class StockAdjustmentCreate(BaseModel):
     """Schema for creating a stock adjustment"""
     reason: str = Field(..., min_length=1, max_length=255)
-    notes: Optional[str] = None
-    lines: list[StockAdjustmentLineCreate] = Field(..., min_items=1)
+    notes: str | None = None
+    lines: list[StockAdjustmentLineCreate] = Field(..., min_length=1)
 
 
-class StockAdjustmentLineResponse(BaseModel):
+class StockAdjustmentLineResponse(ORMResponse):
     """Schema for stock adjustment line response"""
     id: int
     product_id: int
     expected_quantity: int
     actual_quantity: int
     difference: int
-    notes: Optional[str]
-
-    class Config:
-        from_attributes = True
+    notes: str | None = None
 
 
-class StockAdjustmentResponse(BaseModel):
+class StockAdjustmentResponse(ORMResponse):
     """Schema for stock adjustment response"""
     id: int
     adjustment_date: datetime
     reason: str
-    notes: Optional[str]
+    notes: str | None = None
     is_completed: bool
     lines: list[StockAdjustmentLineResponse]
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Settings Schemas
+class DayHours(BaseModel):
+    """Opening hours for a single weekday"""
+    model_config = ConfigDict(defer_build=True)
+
+    open: str = Field(default="09:00")
+    close: str = Field(default="18:00")
+    closed: bool = Field(default=False)
+
+
+class IndiaCurrencyOptions(BaseModel):
+    """India-specific currency display options"""
+    model_config = ConfigDict(defer_build=True)
+
+    enabled: bool = Field(default=False)
+    gstEnabled: bool = Field(default=True)
+    showPaisa: bool = Field(default=True)
+    useIndianNumbering: bool = Field(default=True)
+
+
+class MiddleEastCurrencyOptions(BaseModel):
+    """Middle East currency display options"""
+    model_config = ConfigDict(defer_build=True)
+
+    enabled: bool = Field(default=False)
+    currency: str = Field(default="AED")
+    decimalPlaces: NonNegInt = 2
+
+
+class RegionCurrencyOptions(BaseModel):
+    """Region-specific currency display options"""
+    model_config = ConfigDict(defer_build=True)
+
+    india: IndiaCurrencyOptions = Field(default_factory=IndiaCurrencyOptions)
+    middleEast: MiddleEastCurrencyOptions = Field(default_factory=MiddleEastCurrencyOptions)
+
+
+class CurrencyConfig(BaseModel):
+    """Currency formatting configuration"""
+    # Keys owned by the frontend (e.g. denominationsConfig) are kept as-is
+    model_config = ConfigDict(extra='allow', defer_build=True)
+
+    code: str = Field(default="USD")
+    symbol: str = Field(default="$")
+    symbolPosition: str = Field(default="before")
+    decimalPlaces: NonNegInt = 2
+    thousandSeparator: str = Field(default=",")
+    decimalSeparator: str = Field(default=".")
+    showCurrencyCode: bool = Field(default=False)
+    regionSpecific: RegionCurrencyOptions = Field(default_factory=RegionCurrencyOptions)
+
+
 class GeneralSettings(BaseModel):
     """Schema for general settings"""
+    model_config = ConfigDict(defer_build=True)
+
     storeName: str = Field(default="MidLogic POS")
     businessName: str = Field(default="")
     storeAddress: str = Field(default="")
@@ -533,7 +592,7 @@ class GeneralSettings(BaseModel):
     storeEmail: str = Field(default="")
     storeWebsite: str = Field(default="")
     logoUrl: str = Field(default="")
-    operatingHours: dict = Field(default_factory=dict)
+    operatingHours: dict[str, DayHours] = Field(default_factory=dict)
     currency: str = Field(default="USD")
     language: str = Field(default="en")
     timezone: str = Field(default="UTC")
@@ -541,19 +600,23 @@ class GeneralSettings(BaseModel):
 
 class BusinessSettings(BaseModel):
     """Schema for business settings"""
-    mode: str = Field(default="retail")
+    model_config = ConfigDict(defer_build=True)
+
+    mode: Literal['retail', 'restaurant'] = 'retail'
     enableTableManagement: bool = Field(default=False)
     enableReservations: bool = Field(default=False)
     enableKitchenDisplay: bool = Field(default=False)
     enableBarcodeScanner: bool = Field(default=True)
     enableLoyaltyProgram: bool = Field(default=False)
     enableQuickCheckout: bool = Field(default=True)
-    currencyConfig: dict = Field(default_factory=dict)
+    currencyConfig: CurrencyConfig = Field(default_factory=CurrencyConfig)
 
 
 class TaxSettings(BaseModel):
     """Schema for tax settings"""
-    defaultTaxRate: float = Field(default=0, ge=0, le=100)
+    model_config = ConfigDict(defer_build=True)
+
+    defaultTaxRate: Percent = 0
     taxInclusive: bool = Field(default=False)
     taxLabel: str = Field(default="Tax")
     enableMultipleTaxRates: bool = Field(default=False)
@@ -561,6 +624,8 @@ class TaxSettings(BaseModel):
 
 class HardwareSettings(BaseModel):
     """Schema for hardware settings"""
+    model_config = ConfigDict(defer_build=True)
+
     printerEnabled: bool = Field(default=False)
     printerName: str = Field(default="")
     cashDrawerEnabled: bool = Field(default=False)
@@ -570,6 +635,8 @@ class HardwareSettings(BaseModel):
 
 class ReceiptSettings(BaseModel):
     """Schema for receipt settings"""
+    model_config = ConfigDict(defer_build=True)
+
     showLogo: bool = Field(default=False)
     logoUrl: str = Field(default="")
     headerText: str = Field(default="Thank you for your purchase!")
@@ -582,8 +649,13 @@ class ReceiptSettings(BaseModel):
     paperSize: str = Field(default="A4")
 
 
+_WASTE_REASONS_DEFAULT = ('Damaged', 'Expired', 'Lost', 'Other')
+
+
 class InventorySettings(BaseModel):
     """Schema for comprehensive inventory settings"""
+    model_config = ConfigDict(defer_build=True)
+
     # Stock Tracking Configuration
     enableStockTracking: bool = Field(default=True, description="Enable global inventory tracking")
     trackBySerialNumber: bool = Field(default=False, description="Track items by serial number")
@@ -592,20 +664,20 @@ class InventorySettings(BaseModel):
 
     # Alert & Notification Settings
     enableLowStockAlerts: bool = Field(default=True, description="Enable low stock alerts")
-    lowStockThreshold: int = Field(default=10, ge=0, description="Low stock threshold value")
-    lowStockThresholdType: str = Field(default='absolute', description="Threshold type: 'absolute' or 'percentage'")
+    lowStockThreshold: NonNegInt = Field(default=10, description="Low stock threshold value")
+    lowStockThresholdType: Literal['absolute', 'percentage'] = Field(default='absolute', description="Threshold type: 'absolute' or 'percentage'")
     enableOutOfStockAlerts: bool = Field(default=True, description="Enable out of stock alerts")
-    alertRecipients: list = Field(default_factory=list, description="Email addresses for alerts")
+    alertRecipients: list[str] = Field(default_factory=list, description="Email addresses for alerts")
 
     # Stock Deduction Settings
-    stockDeductionMode: str = Field(default='automatic', description="Stock deduction mode: 'automatic' or 'manual'")
+    stockDeductionMode: Literal['automatic', 'manual'] = Field(default='automatic', description="Stock deduction mode: 'automatic' or 'manual'")
     allowNegativeStock: bool = Field(default=False, description="Allow selling items with negative stock")
     deductOnSale: bool = Field(default=True, description="Deduct stock on sale completion")
     deductOnOrder: bool = Field(default=False, description="Deduct stock on order placement")
 
     # Reorder Point Settings
     enableAutoReorder: bool = Field(default=False, description="Enable automatic reorder suggestions")
-    autoReorderThreshold: int = Field(default=5, ge=0, description="Threshold for auto reorder")
+    autoReorderThreshold: NonNegInt = Field(default=5, description="Threshold for auto reorder")
     autoReorderQuantity: int = Field(default=20, ge=1, description="Default reorder quantity")
     enableReorderPointCalculation: bool = Field(default=False, description="Enable automatic reorder point calculation")
 
@@ -626,12 +698,12 @@ class InventorySettings(BaseModel):
     transferBetweenLocations: bool = Field(default=False, description="Allow stock transfers between locations")
 
     # Stock Valuation Method
-    valuationMethod: str = Field(default='FIFO', description="Stock valuation method: FIFO, LIFO, Weighted Average")
+    valuationMethod: Literal['FIFO', 'LIFO', 'Weighted Average'] = Field(default='FIFO', description="Stock valuation method: FIFO, LIFO, Weighted Average")
     enableCostTracking: bool = Field(default=True, description="Enable cost tracking for inventory")
 
     # Waste & Adjustment Tracking
     enableWasteTracking: bool = Field(default=False, description="Enable waste/damaged inventory tracking")
-    wasteReasons: list = Field(default_factory=lambda: ['Damaged', 'Expired', 'Lost', 'Other'], description="Predefined waste reasons")
+    wasteReasons: tuple[str, ...] = Field(default=_WASTE_REASONS_DEFAULT, description="Predefined waste reasons")
     requireWasteApproval: bool = Field(default=False, description="Require approval for waste entries")
     enableStockAdjustment: bool = Field(default=True, description="Enable manual stock adjustments")
     requireAdjustmentReason: bool = Field(default=True, description="Require reason for stock adjustments")
@@ -650,6 +722,8 @@ class InventorySettings(BaseModel):
 
 class IntegrationSettings(BaseModel):
     """Schema for integration settings"""
+    model_config = ConfigDict(defer_build=True)
+
     enableCloudSync: bool = Field(default=False)
     cloudSyncInterval: int = Field(default=60, ge=1)
     enableEmailReceipts: bool = Field(default=False)
@@ -660,22 +734,28 @@ class IntegrationSettings(BaseModel):
 
 class BackupSettings(BaseModel):
     """Schema for backup settings"""
+    model_config = ConfigDict(defer_build=True)
+
     enableAutoBackup: bool = Field(default=False)
     backupInterval: int = Field(default=24, ge=1)
     backupLocation: str = Field(default="")
-    lastBackupDate: Optional[str] = None
+    lastBackupDate: str | None = None
 
 
 class DisplaySettings(BaseModel):
     """Schema for display settings"""
-    theme: str = Field(default="light")
-    fontSize: str = Field(default="medium")
-    screenTimeout: int = Field(default=0, ge=0)
+    model_config = ConfigDict(defer_build=True)
+
+    theme: Literal['light', 'dark'] = 'light'
+    fontSize: Literal['small', 'medium', 'large'] = 'medium'
+    screenTimeout: NonNegInt = 0
 
 
 class SecuritySettings(BaseModel):
     """Schema for security settings"""
-    sessionTimeout: int = Field(default=0, ge=0)
+    model_config = ConfigDict(defer_build=True)
+
+    sessionTimeout: NonNegInt = 0
     requirePinForRefunds: bool = Field(default=True)
     requirePinForVoids: bool = Field(default=True)
     requirePinForDiscounts: bool = Field(default=False)
@@ -683,14 +763,18 @@ class SecuritySettings(BaseModel):
 
 class SystemInfo(BaseModel):
     """Schema for system information"""
+    model_config = ConfigDict(defer_build=True)
+
     appVersion: str = Field(default="1.0.0")
     buildNumber: str = Field(default="1")
-    lastUpdateCheck: Optional[str] = None
+    lastUpdateCheck: str | None = None
     databaseVersion: str = Field(default="1.0.0")
 
 
-class SettingsResponse(BaseModel):
+class SettingsResponse(ORMResponse):
     """Schema for settings response"""
+    model_config = ConfigDict(defer_build=True)
+
     id: int
     general: GeneralSettings
     business: BusinessSettings
@@ -706,27 +790,26 @@ class SettingsResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class SettingsUpdate(BaseModel):
     """Schema for updating settings"""
-    general: Optional[GeneralSettings] = None
-    business: Optional[BusinessSettings] = None
-    taxes: Optional[TaxSettings] = None
-    hardware: Optional[HardwareSettings] = None
-    receipts: Optional[ReceiptSettings] = None
-    inventory: Optional[InventorySettings] = None
-    integration: Optional[IntegrationSettings] = None
-    backup: Optional[BackupSettings] = None
-    display: Optional[DisplaySettings] = None
-    security: Optional[SecuritySettings] = None
-    about: Optional[SystemInfo] = None
+    model_config = ConfigDict(defer_build=True)
+
+    general: GeneralSettings | None = None
+    business: BusinessSettings | None = None
+    taxes: TaxSettings | None = None
+    hardware: HardwareSettings | None = None
+    receipts: ReceiptSettings | None = None
+    inventory: InventorySettings | None = None
+    integration: IntegrationSettings | None = None
+    backup: BackupSettings | None = None
+    display: DisplaySettings | None = None
+    security: SecuritySettings | None = None
+    about: SystemInfo | None = None
 
 
 # New Normalized Setting Schemas
-class SettingItemResponse(BaseModel):
+class SettingItemResponse(ORMResponse):
     """Schema for individual setting item response"""
     id: int
     section: str
@@ -734,69 +817,68 @@ class SettingItemResponse(BaseModel):
     value: str
     default_value: str
     data_type: str
-    description: Optional[str]
+    description: str | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class SettingItemUpdate(BaseModel):
     """Schema for updating an individual setting"""
-    value: Any  # Will be converted to string based on data_type
+    value: SettingValue  # Will be converted to string based on data_type
 
 
-class SectionSettingsResponse(BaseModel):
+class SectionSettingsResponse(ORMResponse):
     """Schema for all settings in a section"""
     section: str
-    settings: Dict[str, Any]  # Key-value pairs with typed values
+    settings: JsonObject  # Key-value pairs with typed values
 
 
 class BulkSettingsUpdate(BaseModel):
     """Schema for bulk updating multiple settings"""
-    updates: List[Dict[str, Any]]  # List of {section, key, value} dicts
+    updates: list[dict[str, Any]]  # List of {section, key, value} dicts
 
 
 # Tax Rule Schemas
 class TaxRuleCreate(BaseModel):
     """Schema for creating a tax rule"""
+    model_config = ConfigDict(defer_build=True)
+
     name: str = Field(..., min_length=1, max_length=100)
-    description: Optional[str] = None
-    tax_type: str = Field(default="simple")
-    rate: float = Field(default=0, ge=0, le=100)
+    description: str | None = None
+    tax_type: TaxType = "simple"
+    rate: Percent = 0
 
     # Tax calculation configuration
-    calculation_method: str = Field(default="percentage")
-    fixed_amount: Optional[float] = Field(None, ge=0)
-    inclusion_type: str = Field(default="exclusive")
-    rounding_method: str = Field(default="round_half_up")
+    calculation_method: TaxCalculationMethod = "percentage"
+    fixed_amount: Money | None = None
+    inclusion_type: TaxInclusionType = "exclusive"
+    rounding_method: RoundingMethod = "round_half_up"
 
     # GST fields
-    hsn_code: Optional[str] = Field(None, max_length=20)
-    sac_code: Optional[str] = Field(None, max_length=20)
-    cgst_rate: Optional[float] = Field(None, ge=0, le=100)
-    sgst_rate: Optional[float] = Field(None, ge=0, le=100)
-    igst_rate: Optional[float] = Field(None, ge=0, le=100)
-    cess_rate: Optional[float] = Field(None, ge=0, le=100)
+    hsn_code: str | None = Field(None, max_length=20)
+    sac_code: str | None = Field(None, max_length=20)
+    cgst_rate: Percent | None = None
+    sgst_rate: Percent | None = None
+    igst_rate: Percent | None = None
+    cess_rate: Percent | None = None
 
     # Applicability rules
-    applies_to_categories: list = Field(default_factory=list)
-    applies_to_products: list = Field(default_factory=list)
-    min_amount: Optional[float] = Field(None, ge=0)
-    max_amount: Optional[float] = Field(None, ge=0)
-    customer_types: list = Field(default_factory=list)
+    applies_to_categories: list[int] = Field(default_factory=list)
+    applies_to_products: list[int] = Field(default_factory=list)
+    min_amount: Money | None = None
+    max_amount: Money | None = None
+    customer_types: list[str] = Field(default_factory=list)
 
     # Tax exemption
     is_tax_exempt: bool = Field(default=False)
 
     # Date range
-    effective_from: Optional[str] = None  # ISO date string
-    effective_to: Optional[str] = None  # ISO date string
+    effective_from: str | None = None  # ISO date string
+    effective_to: str | None = None  # ISO date string
 
     # Compound tax
     is_compound: bool = Field(default=False)
-    compound_on_taxes: list = Field(default_factory=list)
+    compound_on_taxes: list[int] = Field(default_factory=list)
 
     # Status
     is_active: bool = Field(default=True)
@@ -805,106 +887,110 @@ class TaxRuleCreate(BaseModel):
 
 class TaxRuleUpdate(BaseModel):
     """Schema for updating a tax rule"""
-    name: Optional[str] = Field(None, min_length=1, max_length=100)
-    description: Optional[str] = None
-    tax_type: Optional[str] = None
-    rate: Optional[float] = Field(None, ge=0, le=100)
+    model_config = ConfigDict(defer_build=True)
+
+    name: str | None = Field(None, min_length=1, max_length=100)
+    description: str | None = None
+    tax_type: TaxType | None = None
+    rate: Percent | None = None
 
     # Tax calculation configuration
-    calculation_method: Optional[str] = None
-    fixed_amount: Optional[float] = Field(None, ge=0)
-    inclusion_type: Optional[str] = None
-    rounding_method: Optional[str] = None
+    calculation_method: TaxCalculationMethod | None = None
+    fixed_amount: Money | None = None
+    inclusion_type: TaxInclusionType | None = None
+    rounding_method: RoundingMethod | None = None
 
     # GST fields
-    hsn_code: Optional[str] = Field(None, max_length=20)
-    sac_code: Optional[str] = Field(None, max_length=20)
-    cgst_rate: Optional[float] = Field(None, ge=0, le=100)
-    sgst_rate: Optional[float] = Field(None, ge=0, le=100)
-    igst_rate: Optional[float] = Field(None, ge=0, le=100)
-    cess_rate: Optional[float] = Field(None, ge=0, le=100)
+    hsn_code: str | None = Field(None, max_length=20)
+    sac_code: str | None = Field(None, max_length=20)
+    cgst_rate: Percent | None = None
+    sgst_rate: Percent | None = None
+    igst_rate: Percent | None = None
+    cess_rate: Percent | None = None
 
     # Applicability rules
-    applies_to_categories: Optional[list] = None
-    applies_to_products: Optional[list] = None
-    min_amount: Optional[float] = Field(None, ge=0)
-    max_amount: Optional[float] = Field(None, ge=0)
-    customer_types: Optional[list] = None
+    applies_to_categories: list[int] | None = None
+    applies_to_products: list[int] | None = None
+    min_amount: Money | None = None
+    max_amount: Money | None = None
+    customer_types: list[str] | None = None
 
     # Tax exemption
-    is_tax_exempt: Optional[bool] = None
+    is_tax_exempt: bool | None = None
 
     # Date range
-    effective_from: Optional[str] = None
-    effective_to: Optional[str] = None
+    effective_from: str | None = None
+    effective_to: str | None = None
 
     # Compound tax
-    is_compound: Optional[bool] = None
-    compound_on_taxes: Optional[list] = None
+    is_compound: bool | None = None
+    compound_on_taxes: list[int] | None = None
 
     # Status
-    is_active: Optional[bool] = None
-    priority: Optional[int] = None
+    is_active: bool | None = None
+    priority: int | None = None
 
 
-class TaxRuleResponse(BaseModel):
+class TaxRuleResponse(ORMResponse):
     """Schema for tax rule response"""
+    model_config = ConfigDict(defer_build=True)
+
     id: int
     name: str
-    description: Optional[str]
+    description: str | None = None
     tax_type: str
     rate: float
 
     # Tax calculation configuration
     calculation_method: str
-    fixed_amount: Optional[float]
+    fixed_amount: float | None = None
     inclusion_type: str
     rounding_method: str
 
     # GST fields
-    hsn_code: Optional[str]
-    sac_code: Optional[str]
-    cgst_rate: Optional[float]
-    sgst_rate: Optional[float]
-    igst_rate: Optional[float]
-    cess_rate: Optional[float]
+    hsn_code: str | None = None
+    sac_code: str | None = None
+    cgst_rate: float | None = None
+    sgst_rate: float | None = None
+    igst_rate: float | None = None
+    cess_rate: float | None = None
 
     # Applicability rules
-    applies_to_categories: list
-    applies_to_products: list
-    min_amount: Optional[float]
-    max_amount: Optional[float]
-    customer_types: list
+    applies_to_categories: list[int]
+    applies_to_products: list[int]
+    min_amount: float | None = None
+    max_amount: float | None = None
+    customer_types: list[str]
 
     # Tax exemption
     is_tax_exempt: bool
 
     # Date range
-    effective_from: Optional[str]
-    effective_to: Optional[str]
+    effective_from: date | None = None
+    effective_to: date | None = None
 
     # Compound tax
     is_compound: bool
-    compound_on_taxes: list
+    compound_on_taxes: list[int]
 
     # Status
     is_active: bool
     priority: int
 
     # Metadata
-    created_at: str
-    updated_at: str
-    created_by: Optional[int]
+    created_at: datetime
+    updated_at: datetime
+    created_by: int | None = None
 
-    class Config:
-        from_attributes = True
 
-class BackupRequest(BaseModel):
+@dataclass(slots=True, frozen=True)
+class BackupRequest:
     """Schema for backup request"""
-    location: Optional[str] = None
+    location: str | None = None
 
 
-class RestoreRequest(BaseModel):
+@dataclass(slots=True, frozen=True)
+class RestoreRequest:
     """Schema for restore request"""
     filePath: str = Field(..., min_length=1)
 
@@ -915,10 +1001,12 @@ class RestoreRequest(BaseModel):
 
 class BackupSettingsEnhanced(BaseModel):
     """Enhanced backup settings with advanced features"""
+    model_config = ConfigDict(from_attributes=True, defer_build=True)
+
     enableAutoBackup: bool = Field(default=False)
     backupInterval: int = Field(default=24, ge=1)
     backupLocation: str = Field(default="")
-    lastBackupDate: Optional[str] = None
+    lastBackupDate: str | None = None
     
     # Advanced features
     compressionEnabled: bool = Field(default=True)
@@ -926,13 +1014,12 @@ class BackupSettingsEnhanced(BaseModel):
     backupType: str = Field(default="full")  # full, incremental, selective
     retentionDays: int = Field(default=30, ge=1)
     maxBackupCount: int = Field(default=10, ge=1)
-    
-    class Config:
-        from_attributes = True
 
 
 class BackupMetadata(BaseModel):
     """Backup metadata"""
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     filename: str
     created_at: str
     size_bytes: int
@@ -943,39 +1030,45 @@ class BackupMetadata(BaseModel):
     compression_enabled: bool
     encryption_enabled: bool
     backup_type: str
-    selected_tables: Optional[List[str]] = None
+    selected_tables: list[str] | None = None
     status: str = "success"
-    error_message: Optional[str] = None
+    error_message: str | None = None
 
 
 class BackupInfo(BaseModel):
     """Information about a backup file"""
+    model_config = ConfigDict(frozen=True, defer_build=True)
+
     filename: str
     path: str
     size_bytes: int
     size_mb: float
     created_at: str
     is_compressed: bool
-    metadata: Optional[BackupMetadata] = None
+    metadata: BackupMetadata | None = None
 
 
-class BackupListResponse(BaseModel):
+class BackupListResponse(ORMResponse):
     """Response for listing backups"""
     total: int
-    backups: List[BackupInfo]
+    backups: list[BackupInfo]
 
 
 class AdvancedBackupRequest(BaseModel):
     """Advanced backup request with options"""
-    location: Optional[str] = None
+    model_config = ConfigDict(defer_build=True)
+
+    location: str | None = None
     compression: bool = Field(default=True)
     encryption: bool = Field(default=False)
-    backup_type: str = Field(default="full")  # full, incremental, selective
-    selected_tables: Optional[List[str]] = None
+    backup_type: BackupType = "full"
+    selected_tables: list[str] | None = None
 
 
 class BackupProgressUpdate(BaseModel):
     """Progress update during backup/restore"""
+    model_config = ConfigDict(defer_build=True)
+
     status: str  # pending, in_progress, completed, failed, cancelled
     progress: int = Field(ge=0, le=100)
     message: str
@@ -984,14 +1077,18 @@ class BackupProgressUpdate(BaseModel):
 
 class BackupVerificationResult(BaseModel):
     """Result of backup verification"""
+    model_config = ConfigDict(defer_build=True)
+
     filename: str
     valid: bool
     checksum_match: bool
-    error: Optional[str] = None
+    error: str | None = None
 
 
 class RetentionPolicy(BaseModel):
     """Backup retention policy"""
+    model_config = ConfigDict(defer_build=True)
+
     retention_days: int = Field(default=30, ge=1)
     max_backup_count: int = Field(default=10, ge=1)
     cleanup_on_backup: bool = Field(default=True)
@@ -999,11 +1096,13 @@ class RetentionPolicy(BaseModel):
 
 class ScheduleConfiguration(BaseModel):
     """Backup schedule configuration"""
+    model_config = ConfigDict(defer_build=True)
+
     enabled: bool = Field(default=False)
-    schedule_type: str = Field(default="interval")  # interval, daily, weekly, monthly
+    schedule_type: ScheduleType = "interval"
     interval_hours: int = Field(default=24, ge=1)
-    scheduled_time: Optional[str] = None  # HH:MM format
-    scheduled_days: Optional[List[str]] = None  # ["mon", "tue", ...]
+    scheduled_time: str | None = None  # HH:MM format
+    scheduled_days: list[str] | None = None  # ["mon", "tue", ...]
     
     # Retention and notifications
     retention_policy: RetentionPolicy = Field(default_factory=RetentionPolicy)
@@ -1017,6 +1116,8 @@ class ScheduleConfiguration(BaseModel):
 
 class TransactionSummary(BaseModel):
     """Summary statistics for transactions"""
+    model_config = ConfigDict(frozen=True)
+
     total_sales: float
     total_cash_in: float
     total_cash_out: float
@@ -1029,70 +1130,69 @@ class TransactionSummary(BaseModel):
 
 class TransactionFilter(BaseModel):
     """Filter parameters for transaction queries"""
-    transaction_types: Optional[List[str]] = None
-    start_date: Optional[datetime] = None
-    end_date: Optional[datetime] = None
-    min_amount: Optional[float] = None
-    max_amount: Optional[float] = None
-    user_id: Optional[int] = None
-    customer_id: Optional[int] = None
-    status: Optional[str] = None
-    search_query: Optional[str] = None
-
-
-class UnifiedTransactionResponse(BaseModel):
+    transaction_types: list[str] | None = None
+    start_date: datetime | None = None
+    end_date: datetime | None = None
+    min_amount: float | None = None
+    max_amount: float | None = None
+    user_id: int | None = None
+    customer_id: int | None = None
+    status: str | None = None
+    search_query: str | None = None
+
+
+class UnifiedTransactionResponse(ORMResponse):
     """Unified transaction response for all transaction types"""
     id: int
     transaction_type: str  # sale, stock_in, stock_out, cash_in, cash_out, expense, credit, payment
     amount: float
     description: str
-    reference_number: Optional[str] = None
-    status: Optional[str] = None
-    user_name: Optional[str] = None
-    customer_name: Optional[str] = None
+    reference_number: str | None = None
+    status: str | None = None
+    user_name: str | None = None
+    customer_name: str | None = None
     created_at: datetime
-    metadata: Optional[Dict[str, Any]] = None
-
-    class Config:
-        from_attributes = True
+    metadata: JsonObject | None = None
 
 
-class TransactionListResponse(BaseModel):
+class TransactionListResponse(ORMResponse):
     """Paginated transaction list response"""
     total: int
     page: int
     page_size: int
-    transactions: List[UnifiedTransactionResponse]
-    summary: Optional[TransactionSummary] = None
+    transactions: list[UnifiedTransactionResponse]
+    summary: TransactionSummary | None = None
 
 
 # Sale Schemas
 class SaleItemSchema(BaseModel):
     """Schema for sale line items"""
+    model_config = ConfigDict(frozen=True)
+
     product_id: int
     product_name: str
     quantity: int
-    unit_price: float
-    tax_amount: float
-    discount_amount: float
-    total: float
+    unit_price: Money
+    tax_amount: Money
+    discount_amount: Money
+    total: Money
 
 
 class SaleCreate(BaseModel):
     """Schema for creating a sale"""
-    customer_id: Optional[int] = None
-    items: List[SaleItemSchema]
+    customer_id: int | None = None
+    items: list[SaleItemSchema]
     payment_method: str
-    amount_paid: float
-    notes: Optional[str] = None
+    amount_paid: Money
+    notes: str | None = None
 
 
-class SaleResponse(BaseModel):
+class SaleResponse(ORMResponse):
     """Schema for sale response"""
     id: int
     invoice_number: str
-    customer_id: Optional[int] = None
-    customer_name: Optional[str] = None
+    customer_id: int | None = None
+    customer_name: str | None = None
     subtotal: float
     tax_amount: float
     discount_amount: float
@@ -1101,108 +1201,99 @@ class SaleResponse(BaseModel):
     amount_paid: float
     change_given: float
     status: str
-    items: List[Dict[str, Any]]
-    sold_by_id: Optional[int] = None
-    sold_by_name: Optional[str] = None
+    items: list[JsonObject]
+    sold_by_id: int | None = None
+    sold_by_name: str | None = None
     sale_date: datetime
-    notes: Optional[str] = None
+    notes: str | None = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Cash Transaction Schemas
 class CashTransactionCreate(BaseModel):
     """Schema for creating a cash transaction"""
-    transaction_type: str  # cash_in, cash_out, opening_balance, closing_balance
-    amount: float
-    category: Optional[str] = None
-    description: Optional[str] = None
-    reference_number: Optional[str] = None
-    notes: Optional[str] = None
+    transaction_type: CashTransactionType
+    amount: Money
+    category: str | None = None
+    description: str | None = None
+    reference_number: str | None = None
+    notes: str | None = None
 
 
-class CashTransactionResponse(BaseModel):
+class CashTransactionResponse(ORMResponse):
     """Schema for cash transaction response"""
     id: int
     transaction_type: str
     amount: float
     balance_before: float
     balance_after: float
-    category: Optional[str] = None
-    description: Optional[str] = None
-    reference_number: Optional[str] = None
-    notes: Optional[str] = None
-    performed_by_id: Optional[int] = None
-    performed_by_name: Optional[str] = None
+    category: str | None = None
+    description: str | None = None
+    reference_number: str | None = None
+    notes: str | None = None
+    performed_by_id: int | None = None
+    performed_by_name: str | None = None
     transaction_date: datetime
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # Expense Schemas
 class ExpenseCreate(BaseModel):
     """Schema for creating an expense"""
     title: str
-    description: Optional[str] = None
-    amount: float
+    description: str | None = None
+    amount: Money
     category: str
-    vendor_name: Optional[str] = None
-    vendor_contact: Optional[str] = None
-    payment_method: Optional[str] = None
-    payment_reference: Optional[str] = None
+    vendor_name: str | None = None
+    vendor_contact: str | None = None
+    payment_method: str | None = None
+    payment_reference: str | None = None
     expense_date: datetime
-    due_date: Optional[datetime] = None
-    notes: Optional[str] = None
+    due_date: datetime | None = None
+    notes: str | None = None
 
 
 class ExpenseUpdate(BaseModel):
     """Schema for updating an expense"""
-    title: Optional[str] = None
-    description: Optional[str] = None
-    amount: Optional[float] = None
-    category: Optional[str] = None
-    vendor_name: Optional[str] = None
-    vendor_contact: Optional[str] = None
-    payment_method: Optional[str] = None
-    payment_reference: Optional[str] = None
-    status: Optional[str] = None
-    expense_date: Optional[datetime] = None
-    due_date: Optional[datetime] = None
-    payment_date: Optional[datetime] = None
-    notes: Optional[str] = None
-
-
-class ExpenseResponse(BaseModel):
+    title: str | None = None
+    description: str | None = None
+    amount: Money | None = None
+    category: str | None = None
+    vendor_name: str | None = None
+    vendor_contact: str | None = None
+    payment_method: str | None = None
+    payment_reference: str | None = None
+    status: str | None = None
+    expense_date: datetime | None = None
+    due_date: datetime | None = None
+    payment_date: datetime | None = None
+    notes: str | None = None
+
+
+class ExpenseResponse(ORMResponse):
     """Schema for expense response"""
     id: int
     expense_number: str
     title: str
-    description: Optional[str] = None
+    description: str | None = None
     amount: float
     category: str
     status: str
-    vendor_name: Optional[str] = None
-    vendor_contact: Optional[str] = None
-    payment_method: Optional[str] = None
-    payment_reference: Optional[str] = None
+    vendor_name: str | None = None
+    vendor_contact: str | None = None
+    payment_method: str | None = None
+    payment_reference: str | None = None
     expense_date: datetime
-    due_date: Optional[datetime] = None
-    payment_date: Optional[datetime] = None
-    created_by_id: Optional[int] = None
-    created_by_name: Optional[str] = None
-    approved_by_id: Optional[int] = None
-    approved_by_name: Optional[str] = None
-    notes: Optional[str] = None
+    due_date: datetime | None = None
+    payment_date: datetime | None = None
+    created_by_id: int | None = None
+    created_by_name: str | None = None
+    approved_by_id: int | None = None
+    approved_by_name: str | None = None
+    notes: str | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ===== DISCOUNT SCHEMAS =====
 
@@ -1210,130 +1301,126 @@ class DiscountBase(BaseModel):
     """Base schema for discount"""
     code: str = Field(..., max_length=50, description="Unique discount code")
     name: str = Field(..., max_length=200, description="Display name")
-    description: Optional[str] = None
+    description: str | None = None
     discount_type: str = Field(..., description="Type: percentage, fixed_amount, buy_x_get_y, bundle, free_shipping")
     value: Decimal = Field(..., ge=0, description="Discount value")
-    max_discount_amount: Optional[Decimal] = Field(None, ge=0)
-    min_purchase_amount: Optional[Decimal] = Field(None, ge=0)
-    min_quantity: Optional[int] = Field(None, ge=1)
-    applicable_products: List[int] = Field(default_factory=list)
-    applicable_categories: List[int] = Field(default_factory=list)
-    applicable_customer_segments: List[str] = Field(default_factory=list)
+    max_discount_amount: Decimal | None = Field(None, ge=0)
+    min_purchase_amount: Decimal | None = Field(None, ge=0)
+    min_quantity: int | None = Field(None, ge=1)
+    applicable_products: list[int] = Field(default_factory=list)
+    applicable_categories: list[int] = Field(default_factory=list)
+    applicable_customer_segments: list[str] = Field(default_factory=list)
     first_purchase_only: bool = False
-    buy_quantity: Optional[int] = Field(None, ge=1)
-    get_quantity: Optional[int] = Field(None, ge=1)
-    bundle_products: List[int] = Field(default_factory=list)
-    usage_limit: Optional[int] = Field(None, ge=1)
-    usage_limit_per_customer: Optional[int] = Field(None, ge=1)
-    valid_from: Optional[datetime] = None
-    valid_until: Optional[datetime] = None
+    buy_quantity: int | None = Field(None, ge=1)
+    get_quantity: int | None = Field(None, ge=1)
+    bundle_products: list[int] = Field(default_factory=list)
+    usage_limit: int | None = Field(None, ge=1)
+    usage_limit_per_customer: int | None = Field(None, ge=1)
+    valid_from: datetime | None = None
+    valid_until: datetime | None = None
     time_restrictions: dict = Field(default_factory=dict)
     priority: int = Field(default=0, description="Higher priority applies first")
     can_stack: bool = False
-    stackable_with: List[int] = Field(default_factory=list)
+    stackable_with: list[int] = Field(default_factory=list)
     auto_apply: bool = False
     status: str = Field(default="draft", description="Status: active, inactive, scheduled, expired, draft")
     is_active: bool = True
-    notes: Optional[str] = None
-    tags: List[str] = Field(default_factory=list)
+    notes: str | None = None
+    tags: list[str] = Field(default_factory=list)
 
 
 class DiscountCreate(DiscountBase):
     """Schema for creating a discount"""
-    created_by_id: Optional[int] = None
+    created_by_id: int | None = None
 
 
 class DiscountUpdate(BaseModel):
     """Schema for updating a discount"""
-    code: Optional[str] = Field(None, max_length=50)
-    name: Optional[str] = Field(None, max_length=200)
-    description: Optional[str] = None
-    discount_type: Optional[str] = None
-    value: Optional[Decimal] = Field(None, ge=0)
-    max_discount_amount: Optional[Decimal] = Field(None, ge=0)
-    min_purchase_amount: Optional[Decimal] = Field(None, ge=0)
-    min_quantity: Optional[int] = Field(None, ge=1)
-    applicable_products: Optional[List[int]] = None
-    applicable_categories: Optional[List[int]] = None
-    applicable_customer_segments: Optional[List[str]] = None
-    first_purchase_only: Optional[bool] = None
-    buy_quantity: Optional[int] = Field(None, ge=1)
-    get_quantity: Optional[int] = Field(None, ge=1)
-    bundle_products: Optional[List[int]] = None
-    usage_limit: Optional[int] = Field(None, ge=1)
-    usage_limit_per_customer: Optional[int] = Field(None, ge=1)
-    valid_from: Optional[datetime] = None
-    valid_until: Optional[datetime] = None
-    time_restrictions: Optional[dict] = None
-    priority: Optional[int] = None
-    can_stack: Optional[bool] = None
-    stackable_with: Optional[List[int]] = None
-    auto_apply: Optional[bool] = None
-    status: Optional[str] = None
-    is_active: Optional[bool] = None
-    notes: Optional[str] = None
-    tags: Optional[List[str]] = None
+    code: str | None = Field(None, max_length=50)
+    name: str | None = Field(None, max_length=200)
+    description: str | None = None
+    discount_type: str | None = None
+    value: Decimal | None = Field(None, ge=0)
+    max_discount_amount: Decimal | None = Field(None, ge=0)
+    min_purchase_amount: Decimal | None = Field(None, ge=0)
+    min_quantity: int | None = Field(None, ge=1)
+    applicable_products: list[int] | None = None
+    applicable_categories: list[int] | None = None
+    applicable_customer_segments: list[str] | None = None
+    first_purchase_only: bool | None = None
+    buy_quantity: int | None = Field(None, ge=1)
+    get_quantity: int | None = Field(None, ge=1)
+    bundle_products: list[int] | None = None
+    usage_limit: int | None = Field(None, ge=1)
+    usage_limit_per_customer: int | None = Field(None, ge=1)
+    valid_from: datetime | None = None
+    valid_until: datetime | None = None
+    time_restrictions: dict | None = None
+    priority: int | None = None
+    can_stack: bool | None = None
+    stackable_with: list[int] | None = None
+    auto_apply: bool | None = None
+    status: str | None = None
+    is_active: bool | None = None
+    notes: str | None = None
+    tags: list[str] | None = None
 
 
 class DiscountResponse(DiscountBase):
     """Schema for discount response"""
+    model_config = ConfigDict(frozen=True, extra='ignore', from_attributes=True)
+
     id: int
     usage_count: int
     total_revenue_impact: Decimal
     total_orders: int
-    created_by_id: Optional[int] = None
+    created_by_id: int | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class DiscountUsageCreate(BaseModel):
     """Schema for creating a discount usage record"""
     discount_id: int
-    sale_id: Optional[int] = None
-    customer_id: Optional[int] = None
+    sale_id: int | None = None
+    customer_id: int | None = None
     discount_amount: Decimal = Field(..., ge=0)
     original_amount: Decimal = Field(..., ge=0)
     final_amount: Decimal = Field(..., ge=0)
-    applied_by_id: Optional[int] = None
+    applied_by_id: int | None = None
     metadata: dict = Field(default_factory=dict)
 
 
-class DiscountUsageResponse(BaseModel):
+class DiscountUsageResponse(ORMResponse):
     """Schema for discount usage response"""
     id: int
     discount_id: int
-    sale_id: Optional[int] = None
-    customer_id: Optional[int] = None
+    sale_id: int | None = None
+    customer_id: int | None = None
     discount_amount: Decimal
     original_amount: Decimal
     final_amount: Decimal
-    applied_by_id: Optional[int] = None
+    applied_by_id: int | None = None
     usage_date: datetime
     metadata: dict
 
-    class Config:
-        from_attributes = True
-
 
 class DiscountValidationRequest(BaseModel):
     """Schema for validating a discount"""
     discount_code: str
-    customer_id: Optional[int] = None
-    cart_items: List[dict] = Field(..., description="List of cart items with product_id, quantity, price")
+    customer_id: int | None = None
+    cart_items: list[dict] = Field(..., description="List of cart items with product_id, quantity, price")
     subtotal: Decimal = Field(..., ge=0)
 
 
-class DiscountValidationResponse(BaseModel):
+class DiscountValidationResponse(ORMResponse):
     """Schema for discount validation response"""
     valid: bool
-    discount: Optional[DiscountResponse] = None
+    discount: DiscountResponse | None = None
     discount_amount: Decimal = Field(default=Decimal('0.00'))
     final_amount: Decimal = Field(default=Decimal('0.00'))
-    message: Optional[str] = None
-    errors: List[str] = Field(default_factory=list)
+    message: str | None = None
+    errors: list[str] = Field(default_factory=list)
 
 
 class DiscountDashboardStats(BaseModel):
@@ -1346,10 +1433,10 @@ class DiscountDashboardStats(BaseModel):
     total_usage_count: int
     total_revenue_impact: Decimal
     average_discount_amount: Decimal
-    top_discounts: List[dict]
-    recent_usages: List[DiscountUsageResponse]
+    top_discounts: list[dict]
+    recent_usages: list[DiscountUsageResponse]
     discount_by_type: dict
-    usage_trend: List[dict]
+    usage_trend: list[dict]
 
 
 # ============================================================================
@@ -1361,106 +1448,97 @@ class AccountCreate(BaseModel):
     account_code: str
     account_name: str
     account_type: str
-    account_subtype: Optional[str] = None
-    description: Optional[str] = None
+    account_subtype: str | None = None
+    description: str | None = None
     current_balance: float = 0.0
     is_active: bool = True
-    parent_account_id: Optional[int] = None
+    parent_account_id: int | None = None
 
 
 class AccountUpdate(BaseModel):
     """Schema for updating an account"""
-    account_name: Optional[str] = None
-    description: Optional[str] = None
-    is_active: Optional[bool] = None
+    account_name: str | None = None
+    description: str | None = None
+    is_active: bool | None = None
 
 
-class AccountResponse(BaseModel):
+class AccountResponse(ORMResponse):
     """Schema for account response"""
     id: int
     account_code: str
     account_name: str
     account_type: str
-    account_subtype: Optional[str] = None
-    description: Optional[str] = None
+    account_subtype: str | None = None
+    description: str | None = None
     current_balance: float
     is_active: bool
     is_system: bool
-    parent_account_id: Optional[int] = None
-    parent_account_name: Optional[str] = None
-    created_by_id: Optional[int] = None
-    created_by_name: Optional[str] = None
+    parent_account_id: int | None = None
+    parent_account_name: str | None = None
+    created_by_id: int | None = None
+    created_by_name: str | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 class JournalEntryLineCreate(BaseModel):
     """Schema for creating journal entry line"""
     account_id: int
-    description: Optional[str] = None
+    description: str | None = None
     debit_amount: float = 0.0
     credit_amount: float = 0.0
 
 
-class JournalEntryLineResponse(BaseModel):
+class JournalEntryLineResponse(ORMResponse):
     """Schema for journal entry line response"""
     id: int
     account_id: int
-    account_code: Optional[str] = None
-    account_name: Optional[str] = None
-    description: Optional[str] = None
+    account_code: str | None = None
+    account_name: str | None = None
+    description: str | None = None
     debit_amount: float
     credit_amount: float
     line_number: int
 
-    class Config:
-        from_attributes = True
-
 
 class JournalEntryCreate(BaseModel):
     """Schema for creating journal entry"""
     entry_date: datetime
     entry_type: str
     description: str
-    reference_type: Optional[str] = None
-    reference_id: Optional[int] = None
-    reference_number: Optional[str] = None
-    notes: Optional[str] = None
-    lines: List[JournalEntryLineCreate]
+    reference_type: str | None = None
+    reference_id: int | None = None
+    reference_number: str | None = None
+    notes: str | None = None
+    lines: list[JournalEntryLineCreate]
     auto_post: bool = False
 
 
-class JournalEntryResponse(BaseModel):
+class JournalEntryResponse(ORMResponse):
     """Schema for journal entry response"""
     id: int
     entry_number: str
     entry_date: datetime
     entry_type: str
     description: str
-    reference_type: Optional[str] = None
-    reference_id: Optional[int] = None
-    reference_number: Optional[str] = None
+    reference_type: str | None = None
+    reference_id: int | None = None
+    reference_number: str | None = None
     status: str
-    posted_at: Optional[datetime] = None
+    posted_at: datetime | None = None
     total_debit: float
     total_credit: float
-    created_by_id: Optional[int] = None
-    created_by_name: Optional[str] = None
-    posted_by_id: Optional[int] = None
-    posted_by_name: Optional[str] = None
-    notes: Optional[str] = None
-    lines: List[JournalEntryLineResponse] = []
+    created_by_id: int | None = None
+    created_by_name: str | None = None
+    posted_by_id: int | None = None
+    posted_by_name: str | None = None
+    notes: str | None = None
+    lines: list[JournalEntryLineResponse] = []
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
-class AccountBalanceResponse(BaseModel):
+class AccountBalanceResponse(ORMResponse):
     """Schema for account balance response"""
     account_id: int
     account_code: str
@@ -1472,16 +1550,16 @@ class AccountBalanceResponse(BaseModel):
     transaction_count: int
 
 
-class TrialBalanceResponse(BaseModel):
+class TrialBalanceResponse(ORMResponse):
     """Schema for trial balance report"""
     as_of_date: datetime
-    accounts: List[AccountBalanceResponse]
+    accounts: list[AccountBalanceResponse]
     total_debit: float
     total_credit: float
     is_balanced: bool
 
 
-class FinancialReportResponse(BaseModel):
+class FinancialReportResponse(ORMResponse):
     """Schema for financial reports"""
     report_type: str
     start_date: datetime
@@ -1489,8 +1567,8 @@ class FinancialReportResponse(BaseModel):
     total_income: float
     total_expenses: float
     net_profit: float
-    income_items: List[dict] = []
-    expense_items: List[dict] = []
+    income_items: list[dict] = []
+    expense_items: list[dict] = []
 
 
 class FiscalYearCreate(BaseModel):
@@ -1501,7 +1579,7 @@ class FiscalYearCreate(BaseModel):
     opening_balance: float = 0.0
 
 
-class FiscalYearResponse(BaseModel):
+class FiscalYearResponse(ORMResponse):
     """Schema for fiscal year response"""
     id: int
     year_name: str
@@ -1513,15 +1591,12 @@ class FiscalYearResponse(BaseModel):
     total_income: float
     total_expenses: float
     net_profit_loss: float
-    closed_at: Optional[datetime] = None
-    closed_by_id: Optional[int] = None
-    closed_by_name: Optional[str] = None
-    closing_notes: Optional[str] = None
+    closed_at: datetime | None = None
+    closed_by_id: int | None = None
+    closed_by_name: str | None = None
+    closing_notes: str | None = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
-
 
 # ============================================================================
 # Purchase Schemas
@@ -1530,53 +1605,59 @@ class FiscalYearResponse(BaseModel):
 class PurchaseCreate(BaseModel):
     """Schema for creating a purchase"""
     vendor_name: str
-    vendor_contact: Optional[str] = None
-    vendor_address: Optional[str] = None
+    vendor_contact: str | None = None
+    vendor_address: str | None = None
     purchase_date: datetime
-    expected_delivery_date: Optional[datetime] = None
+    expected_delivery_date: datetime | None = None
     subtotal: float
     tax_amount: float = 0.0
     shipping_cost: float = 0.0
     total_amount: float
-    payment_method: Optional[str] = None
-    items: List[dict]
-    invoice_number: Optional[str] = None
-    notes: Optional[str] = None
+    payment_method: str | None = None
+    items: list[dict]
+    invoice_number: str | None = None
+    notes: str | None = None
 
 
 class PurchaseUpdate(BaseModel):
     """Schema for updating a purchase"""
-    vendor_name: Optional[str] = None
-    vendor_contact: Optional[str] = None
-    expected_delivery_date: Optional[datetime] = None
-    notes: Optional[str] = None
+    vendor_name: str | None = None
+    vendor_contact: str | None = None
+    expected_delivery_date: datetime | None = None
+    notes: str | None = None
 
 
-class PurchaseResponse(BaseModel):
+class PurchaseResponse(ORMResponse):
     """Schema for purchase response"""
     id: int
     purchase_number: str
     vendor_name: str
-    vendor_contact: Optional[str] = None
-    vendor_address: Optional[str] = None
+    vendor_contact: str | None = None
+    vendor_address: str | None = None
     purchase_date: datetime
-    expected_delivery_date: Optional[datetime] = None
-    actual_delivery_date: Optional[datetime] = None
+    expected_delivery_date: datetime | None = None
+    actual_delivery_date: datetime | None = None
     subtotal: float
     tax_amount: float
     shipping_cost: float
     total_amount: float
-    payment_method: Optional[str] = None
+    payment_method: str | None = None
     payment_status: str
     amount_paid: float
     status: str
-    items: List[dict]
-    invoice_number: Optional[str] = None
-    notes: Optional[str] = None
-    created_by_id: Optional[int] = None
-    received_by_id: Optional[int] = None
+    items: list[dict]
+    invoice_number: str | None = None
+    notes: str | None = None
+    created_by_id: int | None = None
+    received_by_id: int | None = None
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+
+
+def warm_deferred_schemas() -> None:
+    """Build the validators of defer_build models ahead of their first request"""
+    for model in list(globals().values()):
+        if (isinstance(model, type) and issubclass(model, BaseModel)
+                and model.__module__ == __name__ and not model.__pydantic_complete__):
+            model.model_rebuild()
@@ -8,7 +8,7 @@ Generated at: 2025-10-21T09:54:53.544743
 """
 from datetime import datetime
 from decimal import Decimal
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 from typing import Optional, Any, Dict, List
 
 
@@ -49,6 +49,8 @@ class UserUpdate(BaseModel):
 
 class UserResponse(BaseModel):
     """Schema for user response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -63,9 +65,6 @@ class UserResponse(BaseModel):
     last_login: Optional[datetime] = Field(None, description="Last login timestamp")
     created_by: Optional[int] = Field(None, description="User who created this account")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # Customer Schemas
@@ -97,6 +96,8 @@ class CustomerUpdate(BaseModel):
 
 class CustomerResponse(BaseModel):
     """Schema for customer response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -110,9 +111,6 @@ class CustomerResponse(BaseModel):
     credit_status: str = Field(default="good", max_length=20, description="Credit status: good, warning, exceeded, blocked")
     created_by: Optional[int] = Field(None, description="User who created this customer record")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # CustomerTransaction Schemas
@@ -148,6 +146,8 @@ class CustomerTransactionUpdate(BaseModel):
 
 class CustomerTransactionResponse(BaseModel):
     """Schema for customertransaction response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -163,9 +163,6 @@ class CustomerTransactionResponse(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes about the transaction")
     created_by: Optional[int] = Field(None, description="User who created this transaction")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # Product Schemas
@@ -237,6 +234,8 @@ class ProductUpdate(BaseModel):
 
 class ProductResponse(BaseModel):
     """Schema for product response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -264,9 +263,6 @@ class ProductResponse(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes")
     created_by: Optional[int] = Field(None, description="User who created this product")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # ProductBundle Schemas
@@ -286,6 +282,8 @@ class ProductBundleUpdate(BaseModel):
 
 class ProductBundleResponse(BaseModel):
     """Schema for productbundle response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -293,9 +291,6 @@ class ProductBundleResponse(BaseModel):
     component_product: int = Field(..., description="Product included in the bundle")
     quantity: int = Field(default=1, description="Quantity of this component in the bundle")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # ProductCategory Schemas
@@ -321,6 +316,8 @@ class ProductCategoryUpdate(BaseModel):
 
 class ProductCategoryResponse(BaseModel):
     """Schema for productcategory response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -331,9 +328,6 @@ class ProductCategoryResponse(BaseModel):
     display_order: int = Field(default=0, description="Display order for sorting")
     is_active: bool = Field(default=True, description="Whether the category is active")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # ProductVariation Schemas
@@ -365,6 +359,8 @@ class ProductVariationUpdate(BaseModel):
 
 class ProductVariationResponse(BaseModel):
     """Schema for productvariation response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -378,9 +374,6 @@ class ProductVariationResponse(BaseModel):
     attributes: Dict = Field(default_factory=dict, description="Variation attributes (e.g., {'size': 'Large', 'color': 'Red'})")
     is_active: bool = Field(default=True, description="Whether this variation is active")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # StockAdjustment Schemas
@@ -404,6 +397,8 @@ class StockAdjustmentUpdate(BaseModel):
 
 class StockAdjustmentResponse(BaseModel):
     """Schema for stockadjustment response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -413,9 +408,6 @@ class StockAdjustmentResponse(BaseModel):
     performed_by: Optional[int] = Field(None, description="User who performed the adjustment")
     is_completed: bool = Field(default=False, description="Whether the adjustment is completed")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # StockAdjustmentLine Schemas
@@ -441,6 +433,8 @@ class StockAdjustmentLineUpdate(BaseModel):
 
 class StockAdjustmentLineResponse(BaseModel):
     """Schema for stockadjustmentline response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -451,9 +445,6 @@ class StockAdjustmentLineResponse(BaseModel):
     difference: int = Field(..., description="Difference (actual - expected)")
     notes: Optional[str] = Field(None, description="Notes for this line item")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # StockTransaction Schemas
@@ -496,6 +487,8 @@ class StockTransactionUpdate(BaseModel):
 
 class StockTransactionResponse(BaseModel):
     """Schema for stocktransaction response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -510,9 +503,6 @@ class StockTransactionResponse(BaseModel):
     notes: Optional[str] = Field(None, description="Additional notes about the transaction")
     performed_by: Optional[int] = Field(None, description="User who performed the transaction")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # Setting Schemas
@@ -545,6 +535,8 @@ class SettingUpdate(BaseModel):
 
 class SettingResponse(BaseModel):
     """Schema for setting response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -555,9 +547,6 @@ class SettingResponse(BaseModel):
     data_type: SettingDataType = Field(default="SettingDataType.STRING", max_length=7, description="Data type for proper value conversion")
     description: Optional[str] = Field(None, description="Human-readable description of the setting")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # Settings Schemas
@@ -593,6 +582,8 @@ class SettingsUpdate(BaseModel):
 
 class SettingsResponse(BaseModel):
     """Schema for settings response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -608,9 +599,6 @@ class SettingsResponse(BaseModel):
     security_settings: Dict = Field(default={'sessionTimeout': 0, 'requirePinForRefunds': True, 'requirePinForVoids': True, 'requirePinForDiscounts': False}, description="Security and access control settings")
     system_info: Dict = Field(default={'appVersion': '1.0.0', 'buildNumber': '1', 'lastUpdateCheck': None, 'databaseVersion': '1.0.0'}, description="System information and metadata")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # TaxRule Schemas
@@ -705,6 +693,8 @@ class TaxRuleUpdate(BaseModel):
 
 class TaxRuleResponse(BaseModel):
     """Schema for taxrule response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(...)
     name: str = Field(..., max_length=100, description="Tax rule name (e.g., 'GST 18%', 'VAT 5%')")
     description: Optional[str] = Field(None, description="Detailed description of the tax rule")
@@ -736,9 +726,6 @@ class TaxRuleResponse(BaseModel):
     updated_at: datetime = Field(...)
     created_by: Optional[int] = Field(None, description="User ID who created this tax rule")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # Sale Schemas
@@ -796,6 +783,8 @@ class SaleUpdate(BaseModel):
 
 class SaleResponse(BaseModel):
     """Schema for sale response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -814,9 +803,6 @@ class SaleResponse(BaseModel):
     sold_by: Optional[int] = Field(None, description="User who processed this sale")
     sale_date: datetime = Field(..., description="Date and time of sale")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # CashTransaction Schemas
@@ -857,6 +843,8 @@ class CashTransactionUpdate(BaseModel):
 
 class CashTransactionResponse(BaseModel):
     """Schema for cashtransaction response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -871,9 +859,6 @@ class CashTransactionResponse(BaseModel):
     performed_by: Optional[int] = Field(None, description="User who performed this transaction")
     transaction_date: datetime = Field(..., description="Date and time of transaction")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # Expense Schemas
@@ -941,6 +926,8 @@ class ExpenseUpdate(BaseModel):
 
 class ExpenseResponse(BaseModel):
     """Schema for expense response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -962,9 +949,6 @@ class ExpenseResponse(BaseModel):
     approved_by: Optional[int] = Field(None, description="User who approved this expense")
     notes: Optional[str] = Field(None, description="Additional notes")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # Discount Schemas
@@ -1058,6 +1042,8 @@ class DiscountUpdate(BaseModel):
 
 class DiscountResponse(BaseModel):
     """Schema for discount response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -1094,9 +1080,6 @@ class DiscountResponse(BaseModel):
     notes: Optional[str] = Field(None, description="Internal notes about the discount")
     tags: Dict = Field(default_factory=list, description="Tags for categorizing discounts")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # DiscountUsage Schemas
@@ -1128,6 +1111,8 @@ class DiscountUsageUpdate(BaseModel):
 
 class DiscountUsageResponse(BaseModel):
     """Schema for discountusage response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -1141,9 +1126,6 @@ class DiscountUsageResponse(BaseModel):
     usage_date: datetime = Field(..., description="When the discount was used")
     metadata: Dict = Field(default_factory=dict, description="Additional context about the usage")
 
-    class Config:
-        from_attributes = True
-
 
 # ================================================================================
 # UserActivityLog Schemas
@@ -1171,6 +1153,8 @@ class UserActivityLogUpdate(BaseModel):
 
 class UserActivityLogResponse(BaseModel):
     """Schema for useractivitylog response"""
+    model_config = ConfigDict(from_attributes=True)
+
     id: int = Field(..., description="Primary key")
     created_at: datetime = Field(..., description="Timestamp when the record was created")
     updated_at: datetime = Field(..., description="Timestamp when the record was last updated")
@@ -1181,6 +1165,3 @@ class UserActivityLogResponse(BaseModel):
     ip_address: Optional[str] = Field(None, max_length=45, description="IP address of the user (IPv4 or IPv6)")
     duration_ms: Optional[int] = Field(None, description="Duration of the activity in milliseconds")
     metadata: Optional[Dict] = Field(None, description="Additional metadata about the activity (JSON)")
-
-    class Config:
-        from_attributes = True
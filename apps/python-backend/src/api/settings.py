@@ -15,34 +15,28 @@ Enhanced backup/restore functionality includes:
 import asyncio
 import logging
 import re
-import shutil
+import secrets
+import time
 from datetime import datetime
-from pathlib import Path
+from functools import lru_cache
 from pathlib import Path as PathlibPath
-from typing import Dict, Any
-from fastapi import APIRouter, HTTPException, status
+from typing import Dict, Any, Tuple
+import orjson
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from tortoise import timezone
 from tortoise.exceptions import DoesNotExist
 
-from ..database.models.setting import Setting
+from ..database.config import DB_PATH
+from ..database.models.setting import Setting, VALUE_DECODERS
 from ..database.defaults import get_default_settings
 from ..utils.backup_manager import BackupManager
 from ..utils.backup_scheduler import BackupScheduler, BackupProgressTracker
+from .helpers import setting_to_response
 from .schemas import (
     SettingsResponse,
     SettingsUpdate,
     BackupRequest,
     RestoreRequest,
-    GeneralSettings,
-    BusinessSettings,
-    TaxSettings,
-    HardwareSettings,
-    ReceiptSettings,
-    InventorySettings,
-    IntegrationSettings,
-    BackupSettings,
-    DisplaySettings,
-    SecuritySettings,
-    SystemInfo,
     SettingItemResponse,
     SettingItemUpdate,
     SectionSettingsResponse,
@@ -58,6 +52,12 @@ from .schemas import (
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Sections exposed through the aggregated SettingsResponse/SettingsUpdate schemas
+SETTINGS_SECTIONS = (
+    'general', 'business', 'taxes', 'hardware', 'receipts', 'inventory',
+    'integration', 'backup', 'display', 'security', 'about'
+)
+
 # Global backup manager instance
 _backup_manager: BackupManager = None
 _backup_scheduler: BackupScheduler = None
@@ -65,12 +65,32 @@ _progress_tracker: BackupProgressTracker = None
 _backup_operation_lock: asyncio.Lock = asyncio.Lock()
 _restore_operation_lock: asyncio.Lock = asyncio.Lock()
 
+# Characters stripped from user-supplied backup/restore paths
+_UNSAFE_PATH_CHARS = re.compile(r'[^a-zA-Z0-9._\-/]')
+
+# Serialized /backups body as ((backup_dir, dir_mtime), fetched_at, body)
+_BACKUP_LIST_TTL = 10.0
+_backup_list_cache: tuple[tuple[str, float], float, str | bytes] | None = None
+
+# Pre-serialized body for the common "no backups yet" case
+_EMPTY_BACKUP_LIST = orjson.dumps({'total': 0, 'backups': []})
+
+# Serialized GET / body, tagged with the settings version it was built from
+_settings_version: int = 0
+# Set once the setting table is known to be populated; skips the COUNT on later reads
+_settings_initialized: bool = False
+_settings_cache: tuple[int, bytes] | None = None
+# Serialized section / individual setting bodies, each tagged with its settings version
+_SETTINGS_READ_CACHE_SIZE = 256
+_settings_read_cache: Dict[Tuple[str, ...], Tuple[int, str]] = {}
+# Per-process ETag prefix so version numbers from an earlier run never match
+_ETAG_PREFIX = secrets.token_hex(4)
+
 
 def get_backup_manager() -> BackupManager:
     """Get or create backup manager instance"""
     global _backup_manager
     if _backup_manager is None:
-        from ..database.config import DB_PATH
         _backup_manager = BackupManager(DB_PATH)
     return _backup_manager
 
@@ -79,7 +99,6 @@ def get_backup_scheduler() -> BackupScheduler:
     """Get or create backup scheduler instance"""
     global _backup_scheduler
     if _backup_scheduler is None:
-        from ..database.config import DB_PATH
         backup_manager = get_backup_manager()
         _backup_scheduler = BackupScheduler(backup_manager, DB_PATH)
     return _backup_scheduler
@@ -93,11 +112,78 @@ def get_progress_tracker() -> BackupProgressTracker:
     return _progress_tracker
 
 
+def invalidate_settings_cache(rows_replaced: bool = False) -> None:
+    """
+    Mark the cached settings bodies stale; call after any write to the setting table.
+
+    Pass rows_replaced=True when rows may have been deleted or swapped out wholesale
+    (restore, demo data) so the next read re-checks that defaults exist.
+    """
+    global _settings_version, _settings_initialized
+    _settings_version += 1
+    _settings_read_cache.clear()
+    if rows_replaced:
+        _settings_initialized = False
+
+
+def _get_cached_read(cache_key: Tuple[str, ...]) -> str | None:
+    """Cached body for a settings read, if it was built at the current version"""
+    entry = _settings_read_cache.get(cache_key)
+    if entry is not None and entry[0] == _settings_version:
+        return entry[1]
+    return None
+
+
+def _settings_etag(version: int) -> str:
+    return f'W/"{_ETAG_PREFIX}-{version}"'
+
+
+def _settings_not_modified(request: Request) -> Response | None:
+    """
+    304 response when the client's If-None-Match names the current settings version.
+
+    Any settings write bumps the version, so a match means nothing changed since
+    the client's copy was served.
+    """
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return None
+    etag = _settings_etag(_settings_version)
+    if etag not in (tag.strip() for tag in header.split(',')):
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": "no-cache"}
+    )
+
+
+def _settings_json_response(body: str | bytes, version: int) -> Response:
+    """JSON settings body tagged with the version it was read at; clients must revalidate"""
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": _settings_etag(version), "Cache-Control": "no-cache"}
+    )
+
+
+def _store_cached_read(cache_key: Tuple[str, ...], version: int, body: str) -> None:
+    """Remember a settings read body, evicting the oldest entry when full"""
+    if len(_settings_read_cache) >= _SETTINGS_READ_CACHE_SIZE:
+        _settings_read_cache.pop(next(iter(_settings_read_cache)))
+    _settings_read_cache[cache_key] = (version, body)
+
+
+def invalidate_backup_list_cache() -> None:
+    """Drop the cached /backups body; call after creating or removing backup files"""
+    global _backup_list_cache
+    _backup_list_cache = None
+
+
 def _sanitize_file_path(file_path: str) -> PathlibPath:
     """Sanitize and validate file path to prevent path traversal attacks"""
     try:
         # Remove any potentially dangerous characters
-        clean_path = re.sub(r'[^a-zA-Z0-9._\-/]', '', file_path)
+        clean_path = _UNSAFE_PATH_CHARS.sub('', file_path)
         path = PathlibPath(clean_path).resolve()
         
         # Ensure path doesn't contain parent directory references
@@ -109,15 +195,17 @@ def _sanitize_file_path(file_path: str) -> PathlibPath:
         raise ValueError(f"Invalid file path: {e}")
 
 
+def _prepare_backup_dir(location: str) -> PathlibPath:
+    """Sanitize a requested backup location and create it; blocking, run in a thread"""
+    backup_path = _sanitize_file_path(location)
+    backup_path.mkdir(parents=True, exist_ok=True)
+    return backup_path
+
+
 def _log_audit_event(operation: str, details: Dict[str, Any], success: bool = True) -> None:
     """Log audit trail for backup/restore operations"""
-    log_entry = {
-        "timestamp": datetime.now().isoformat(),
-        "operation": operation,
-        "success": success,
-        "details": details
-    }
-    logger.info(f"AUDIT: {operation} - {'SUCCESS' if success else 'FAILED'} - {details}")
+    # Lazy %-args: details is only repr'd when INFO records are actually emitted
+    logger.info("AUDIT: %s - %s - %s", operation, 'SUCCESS' if success else 'FAILED', details)
 
 
 async def ensure_settings_initialized():
@@ -125,78 +213,125 @@ async def ensure_settings_initialized():
     Ensure settings are initialized with defaults.
     Called on first access to settings.
     """
+    global _settings_initialized
+    if _settings_initialized:
+        return
+
     count = await Setting.all().count()
     if count == 0:
         logger.info("Initializing settings with defaults...")
         defaults = get_default_settings()
         created = await Setting.initialize_defaults(defaults)
+        invalidate_settings_cache()
         logger.info(f"Initialized {created} default settings")
+    _settings_initialized = True
+
+
+@lru_cache(maxsize=None)
+def get_section_defaults(section: str) -> Dict[str, Any]:
+    """
+    Schema defaults for a settings section.
+
+    Used to fill in keys that are declared by the section schema but not yet stored.
+    """
+    return SettingsResponse.model_fields[section].annotation().model_dump()
 
 
-async def aggregate_settings_by_section() -> Dict[str, Dict[str, Any]]:
+async def aggregate_settings_by_section() -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Any]]:
     """
     Aggregate all settings grouped by section with typed values.
 
     Returns:
-        Dictionary mapping section names to setting dictionaries
+        Tuple of (dictionary mapping section names to setting dictionaries,
+        row metadata with the lowest id, earliest created_at and latest updated_at;
+        all None when no settings are stored)
     """
     sections = {}
-    all_settings = await Setting.all()
-
-    for setting in all_settings:
-        if setting.section not in sections:
-            sections[setting.section] = {}
-        sections[setting.section][setting.key] = setting.get_typed_value()
+    meta = {'id': None, 'created_at': None, 'updated_at': None}
+    # Plain tuples of the needed columns; skips building a Setting per row
+    rows = await Setting.all().values_list(
+        'section', 'key', 'value', 'data_type', 'id', 'created_at', 'updated_at'
+    )
+
+    for section, key, value, data_type, row_id, created_at, updated_at in rows:
+        sections.setdefault(section, {})[key] = VALUE_DECODERS[data_type](value)
+        if meta['id'] is None or row_id < meta['id']:
+            meta['id'] = row_id
+        if meta['created_at'] is None or created_at < meta['created_at']:
+            meta['created_at'] = created_at
+        if meta['updated_at'] is None or updated_at > meta['updated_at']:
+            meta['updated_at'] = updated_at
+
+    return sections, meta
+
+
+async def build_settings_body() -> Tuple[int, bytes]:
+    """
+    Serialize the aggregated settings in the old SettingsResponse format.
+
+    Returns the settings version the body was read at along with the body.
+
+    Stores the result as the cached GET / body unless the table is empty, so
+    the next GET still runs the default initialization.
+    """
+    global _settings_cache
+    # Taken before reading so a write racing with this request leaves the entry stale
+    version = _settings_version
+
+    # Get all settings aggregated by section
+    sections, meta = await aggregate_settings_by_section()
+
+    # Timestamps come from the same rows (or use current time if none exist)
+    if meta['id'] is not None:
+        created_at = meta['created_at']
+        updated_at = meta['updated_at']
+        setting_id = meta['id']
+    else:
+        created_at = datetime.now()
+        updated_at = datetime.now()
+        setting_id = 1
+
+    # Build the response matching the old format straight from the typed
+    # DB values instead of instantiating the 11 section models; each section
+    # exposes exactly the keys its schema declares, defaulting missing ones
+    content = {'id': setting_id}
+    for section in SETTINGS_SECTIONS:
+        values = sections.get(section, {})
+        content[section] = {
+            key: values.get(key, default)
+            for key, default in get_section_defaults(section).items()
+        }
+    content['created_at'] = created_at
+    content['updated_at'] = updated_at
 
-    return sections
+    body = orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    if meta['id'] is not None:
+        _settings_cache = (version, body)
+    return version, body
 
 
 @router.get("/", response_model=SettingsResponse)
-async def get_settings():
+async def get_settings(request: Request):
     """
     Get application settings.
 
     Returns all settings aggregated by section, maintaining backward
     compatibility with the old JSON-based Settings model API.
+    Answers 304 when If-None-Match carries the current ETag.
     """
+    not_modified = _settings_not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    if _settings_cache is not None and _settings_cache[0] == _settings_version:
+        return _settings_json_response(_settings_cache[1], _settings_cache[0])
+
     try:
         # Ensure settings are initialized
         await ensure_settings_initialized()
-
-        # Get all settings aggregated by section
-        sections = await aggregate_settings_by_section()
-
-        # Get first setting's timestamps (or use current time if none exist)
-        first_setting = await Setting.first()
-        if first_setting:
-            created_at = first_setting.created_at
-            updated_at = first_setting.updated_at
-            setting_id = first_setting.id
-        else:
-            created_at = datetime.now()
-            updated_at = datetime.now()
-            setting_id = 1
-
-        # Build response matching old format
-        response = SettingsResponse(
-            id=setting_id,
-            general=GeneralSettings(**sections.get('general', {})),
-            business=BusinessSettings(**sections.get('business', {})),
-            taxes=TaxSettings(**sections.get('taxes', {})),
-            hardware=HardwareSettings(**sections.get('hardware', {})),
-            receipts=ReceiptSettings(**sections.get('receipts', {})),
-            inventory=InventorySettings(**sections.get('inventory', {})),
-            integration=IntegrationSettings(**sections.get('integration', {})),
-            backup=BackupSettings(**sections.get('backup', {})),
-            display=DisplaySettings(**sections.get('display', {})),
-            security=SecuritySettings(**sections.get('security', {})),
-            about=SystemInfo(**sections.get('about', {})),
-            created_at=created_at,
-            updated_at=updated_at
-        )
+        version, body = await build_settings_body()
 
         logger.info("Settings retrieved successfully")
-        return response
+        return _settings_json_response(body, version)
 
     except Exception as e:
         logger.error(f"Failed to retrieve settings: {e}")
@@ -216,30 +351,27 @@ async def update_settings(settings_data: SettingsUpdate):
     Maintains backward compatibility with old API.
     """
     try:
-        # Map section names to update data
-        section_mapping = {
-            'general': settings_data.general,
-            'business': settings_data.business,
-            'taxes': settings_data.taxes,
-            'hardware': settings_data.hardware,
-            'receipts': settings_data.receipts,
-            'inventory': settings_data.inventory,
-            'integration': settings_data.integration,
-            'backup': settings_data.backup,
-            'display': settings_data.display,
-            'security': settings_data.security,
-            'about': settings_data.about
-        }
-
-        # Update each section that has data
-        for section, data in section_mapping.items():
+        # Flatten every section that has data into one batched write; only the
+        # keys the client actually sent are written
+        updates = []
+        for section in SETTINGS_SECTIONS:
+            data = getattr(settings_data, section)
             if data is not None:
-                settings_dict = data.model_dump()
-                await Setting.update_section(section, settings_dict)
-                logger.info(f"Updated {section} settings: {len(settings_dict)} values")
+                settings_dict = data.model_dump(exclude_unset=True)
+                updates.extend(
+                    {'section': section, 'key': key, 'value': value}
+                    for key, value in settings_dict.items()
+                )
+                logger.info(f"Updating {section} settings: {len(settings_dict)} values")
+        try:
+            await Setting.bulk_update(updates)
+        finally:
+            invalidate_settings_cache()
 
-        # Return updated settings in old format
-        return await get_settings()
+        # Return updated settings in old format; rows were just written, so
+        # the initialization check in get_settings is skipped
+        version, body = await build_settings_body()
+        return _settings_json_response(body, version)
 
     except Exception as e:
         logger.error(f"Failed to update settings: {e}")
@@ -249,6 +381,15 @@ async def update_settings(settings_data: SettingsUpdate):
         )
 
 
+async def _record_last_backup_date() -> None:
+    """Stamp backup.lastBackupDate in one UPDATE, without loading the row first"""
+    await Setting.filter(section='backup', key='lastBackupDate').update(
+        value=datetime.now().isoformat(),
+        updated_at=timezone.now()
+    )
+    invalidate_settings_cache()
+
+
 @router.post("/backup", status_code=status.HTTP_200_OK)
 async def perform_backup(backup_request: BackupRequest):
     """
@@ -271,9 +412,9 @@ async def perform_backup(backup_request: BackupRequest):
             # Determine backup location with validation
             if backup_request.location:
                 try:
-                    backup_path = _sanitize_file_path(backup_request.location)
-                    backup_manager.backup_dir = backup_path
-                    backup_manager.backup_dir.mkdir(parents=True, exist_ok=True)
+                    backup_manager.backup_dir = await asyncio.to_thread(
+                        _prepare_backup_dir, backup_request.location
+                    )
                 except Exception as e:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
@@ -281,10 +422,12 @@ async def perform_backup(backup_request: BackupRequest):
                     )
             
             # Create basic backup
-            metadata = backup_manager.create_backup(compression=True, backup_type='full')
+            metadata = await asyncio.to_thread(
+                backup_manager.create_backup, compression=True, backup_type='full'
+            )
             
-            # Update lastBackupDate setting
-            await Setting.update_setting('backup', 'lastBackupDate', datetime.now().isoformat())
+            await _record_last_backup_date()
+            invalidate_backup_list_cache()
             
             # Log audit event
             _log_audit_event("backup_create", {
@@ -347,9 +490,9 @@ async def perform_advanced_backup(backup_request: AdvancedBackupRequest):
             # Determine backup location with validation
             if backup_request.location:
                 try:
-                    backup_path = _sanitize_file_path(backup_request.location)
-                    backup_manager.backup_dir = backup_path
-                    backup_manager.backup_dir.mkdir(parents=True, exist_ok=True)
+                    backup_manager.backup_dir = await asyncio.to_thread(
+                        _prepare_backup_dir, backup_request.location
+                    )
                 except Exception as e:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
@@ -357,15 +500,16 @@ async def perform_advanced_backup(backup_request: AdvancedBackupRequest):
                     )
             
             # Create advanced backup
-            metadata = backup_manager.create_backup(
+            metadata = await asyncio.to_thread(
+                backup_manager.create_backup,
                 compression=backup_request.compression,
                 encryption=backup_request.encryption,
                 backup_type=backup_request.backup_type,
                 selected_tables=backup_request.selected_tables
             )
             
-            # Update lastBackupDate setting
-            await Setting.update_setting('backup', 'lastBackupDate', datetime.now().isoformat())
+            await _record_last_backup_date()
+            invalidate_backup_list_cache()
             
             # Log audit event
             _log_audit_event("backup_create_advanced", {
@@ -439,21 +583,26 @@ async def restore_backup(restore_request: RestoreRequest):
         try:
             # Sanitize file path
             try:
-                backup_file = _sanitize_file_path(restore_request.filePath)
+                backup_file = await asyncio.to_thread(_sanitize_file_path, restore_request.filePath)
             except ValueError as e:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid file path: {str(e)}"
                 )
         
-            if not backup_file.exists():
+            if not await asyncio.to_thread(backup_file.exists):
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Backup file not found: {restore_request.filePath}"
                 )
             
             backup_manager = get_backup_manager()
-            result = backup_manager.restore_backup(backup_file, verify_checksum=True)
+            result = await asyncio.to_thread(
+                backup_manager.restore_backup, backup_file, verify_checksum=True
+            )
+            invalidate_settings_cache(rows_replaced=True)
+            # The restore also writes a pre-restore backup
+            invalidate_backup_list_cache()
             
             # Log audit event
             _log_audit_event("backup_restore", {
@@ -495,10 +644,12 @@ async def get_database_info():
     Get database information including size and location.
     """
     try:
-        from ..database.config import DB_PATH
-        
-        if DB_PATH.exists():
-            size_bytes = DB_PATH.stat().st_size
+        try:
+            size_bytes = (await asyncio.to_thread(DB_PATH.stat)).st_size
+        except FileNotFoundError:
+            size_bytes = None
+
+        if size_bytes is not None:
             size_mb = size_bytes / (1024 * 1024)
             
             return {
@@ -530,19 +681,43 @@ async def list_backups():
     """
     List all available backups with metadata.
     
+    Scans are cached for a few seconds per backup directory mtime; if a scan
+    fails, the last good listing is served with an X-Cache-Status: stale header.
+
     Returns:
         List of backup files with detailed information
     """
+    global _backup_list_cache
     try:
         backup_manager = get_backup_manager()
-        backups = backup_manager.list_backups()
-        
-        return BackupListResponse(
-            total=len(backups),
-            backups=backups
-        )
+        backup_dir = backup_manager.backup_dir
+        dir_mtime = (await asyncio.to_thread(backup_dir.stat)).st_mtime
+        cache_key = (str(backup_dir), dir_mtime)
+
+        cached = _backup_list_cache
+        if cached is not None and cached[0] == cache_key and time.monotonic() - cached[1] < _BACKUP_LIST_TTL:
+            return Response(content=cached[2], media_type="application/json")
+
+        backups = await asyncio.to_thread(backup_manager.list_backups)
+        if not backups:
+            body = _EMPTY_BACKUP_LIST
+        else:
+            body = BackupListResponse(
+                total=len(backups),
+                backups=backups
+            ).model_dump_json()
+        _backup_list_cache = (cache_key, time.monotonic(), body)
+
+        return Response(content=body, media_type="application/json")
         
     except Exception as e:
+        if _backup_list_cache is not None:
+            logger.warning(f"Failed to list backups, serving last listing: {e}")
+            return Response(
+                content=_backup_list_cache[2],
+                media_type="application/json",
+                headers={"X-Cache-Status": "stale"}
+            )
         logger.error(f"Failed to list backups: {e}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -567,7 +742,8 @@ async def delete_backup(filename: str):
             )
         
         backup_manager = get_backup_manager()
-        backup_manager.delete_backup(filename)
+        await asyncio.to_thread(backup_manager.delete_backup, filename)
+        invalidate_backup_list_cache()
         
         # Log audit event
         _log_audit_event("backup_delete", {"filename": filename}, success=True)
@@ -605,7 +781,7 @@ async def verify_backup(filename: str):
     """
     try:
         backup_manager = get_backup_manager()
-        result = backup_manager.verify_backup(filename)
+        result = await asyncio.to_thread(backup_manager.verify_backup, filename)
         
         return BackupVerificationResult(**result)
         
@@ -635,10 +811,12 @@ async def cleanup_backups(retention_policy: RetentionPolicy):
     """
     try:
         backup_manager = get_backup_manager()
-        deleted_count = backup_manager.cleanup_old_backups(
+        deleted_count = await asyncio.to_thread(
+            backup_manager.cleanup_old_backups,
             retention_days=retention_policy.retention_days,
             max_backups=retention_policy.max_backup_count
         )
+        invalidate_backup_list_cache()
         
         return {
             "success": True,
@@ -656,7 +834,7 @@ async def cleanup_backups(retention_policy: RetentionPolicy):
 # ===== NEW GRANULAR SETTINGS ENDPOINTS =====
 
 @router.get("/{section}", response_model=SectionSettingsResponse)
-async def get_section_settings(section: str):
+async def get_section_settings(section: str, request: Request):
     """
     Get all settings for a specific section.
 
@@ -666,7 +844,16 @@ async def get_section_settings(section: str):
     Returns:
         All settings in the section as key-value pairs
     """
+    not_modified = _settings_not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    cache_key = ('section', section)
+    body = _get_cached_read(cache_key)
+    if body is not None:
+        return _settings_json_response(body, _settings_version)
+
     try:
+        version = _settings_version
         settings = await Setting.get_section(section)
 
         if not settings:
@@ -675,10 +862,12 @@ async def get_section_settings(section: str):
                 detail=f"Section '{section}' not found or has no settings"
             )
 
-        return SectionSettingsResponse(
+        body = SectionSettingsResponse(
             section=section,
             settings=settings
-        )
+        ).model_dump_json()
+        _store_cached_read(cache_key, version, body)
+        return _settings_json_response(body, version)
 
     except HTTPException:
         raise
@@ -691,7 +880,7 @@ async def get_section_settings(section: str):
 
 
 @router.get("/{section}/{key}", response_model=SettingItemResponse)
-async def get_individual_setting(section: str, key: str):
+async def get_individual_setting(section: str, key: str, request: Request):
     """
     Get an individual setting by section and key.
 
@@ -702,9 +891,20 @@ async def get_individual_setting(section: str, key: str):
     Returns:
         Individual setting details
     """
+    not_modified = _settings_not_modified(request)
+    if not_modified is not None:
+        return not_modified
+    cache_key = ('item', section, key)
+    body = _get_cached_read(cache_key)
+    if body is not None:
+        return _settings_json_response(body, _settings_version)
+
     try:
+        version = _settings_version
         setting = await Setting.get(section=section, key=key)
-        return setting
+        body = setting_to_response(setting).model_dump_json()
+        _store_cached_read(cache_key, version, body)
+        return _settings_json_response(body, version)
 
     except DoesNotExist:
         raise HTTPException(
@@ -734,6 +934,7 @@ async def update_individual_setting(section: str, key: str, update: SettingItemU
     """
     try:
         setting = await Setting.update_setting(section, key, update.value)
+        invalidate_settings_cache()
         logger.info(f"Updated setting {section}.{key}")
         return setting
 
@@ -762,7 +963,10 @@ async def bulk_update_settings(bulk_update: BulkSettingsUpdate):
         Number of settings updated
     """
     try:
-        updated = await Setting.bulk_update(bulk_update.updates)
+        # Setting.bulk_update collapses repeated (section, key) pairs, last one wins
+        updated = await Setting.bulk_update(bulk_update.updates) if bulk_update.updates else []
+        if updated:
+            invalidate_settings_cache()
         logger.info(f"Bulk updated {len(updated)} settings")
 
         return {
@@ -42,14 +42,14 @@ def tax_rule_to_response(tax_rule: TaxRule) -> TaxRuleResponse:
         max_amount=float(tax_rule.max_amount) if tax_rule.max_amount else None,
         customer_types=tax_rule.customer_types,
         is_tax_exempt=tax_rule.is_tax_exempt,
-        effective_from=tax_rule.effective_from.isoformat() if tax_rule.effective_from else None,
-        effective_to=tax_rule.effective_to.isoformat() if tax_rule.effective_to else None,
+        effective_from=tax_rule.effective_from,
+        effective_to=tax_rule.effective_to,
         is_compound=tax_rule.is_compound,
         compound_on_taxes=tax_rule.compound_on_taxes,
         is_active=tax_rule.is_active,
         priority=tax_rule.priority,
-        created_at=tax_rule.created_at.isoformat(),
-        updated_at=tax_rule.updated_at.isoformat(),
+        created_at=tax_rule.created_at,
+        updated_at=tax_rule.updated_at,
         created_by=tax_rule.created_by
     )
 
@@ -6,8 +6,10 @@ import logging
 from datetime import datetime, timedelta
 from decimal import Decimal
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Query, status
+from fastapi import APIRouter, HTTPException, Query, Response, status
+from pydantic import TypeAdapter
 from tortoise.exceptions import DoesNotExist
+from tortoise.functions import Count, Sum
 
 from ..database.models import (
     Sale,
@@ -29,10 +31,74 @@ from .schemas import (
     ExpenseUpdate,
     CashTransactionCreate
 )
+from .helpers import list_json_response
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Serializer for a page of unified transactions; the overview envelope is composed around it
+_TX_LIST_ADAPTER = TypeAdapter(list[UnifiedTransactionResponse])
+
+
+# Helper functions
+async def sum_and_count(queryset, field: str) -> tuple[float, int]:
+    """Aggregate a queryset in SQL, returning (sum of field, row count)"""
+    row = await queryset.annotate(total=Sum(field), count=Count('id')).first().values('total', 'count')
+    if not row:
+        return 0.0, 0
+    return float(row['total'] or 0), row['count'] or 0
+
+
+def sale_to_response(sale: Sale) -> SaleResponse:
+    """Convert Sale model (with sold_by/customer prefetched) to SaleResponse schema"""
+    return SaleResponse.model_construct(
+        id=sale.id,
+        invoice_number=sale.invoice_number,
+        customer_id=sale.customer_id,
+        customer_name=sale.customer.name if sale.customer else None,
+        subtotal=float(sale.subtotal),
+        tax_amount=float(sale.tax_amount),
+        discount_amount=float(sale.discount_amount),
+        total_amount=float(sale.total_amount),
+        payment_method=sale.payment_method.value,
+        amount_paid=float(sale.amount_paid),
+        change_given=float(sale.change_given),
+        status=sale.status.value,
+        notes=sale.notes,
+        items=sale.items,
+        sold_by_id=sale.sold_by_id,
+        sold_by_name=sale.sold_by.full_name if sale.sold_by else None,
+        sale_date=sale.sale_date,
+        created_at=sale.created_at
+    )
+
+
+def expense_to_response(expense: Expense) -> ExpenseResponse:
+    """Convert Expense model (with created_by/approved_by prefetched) to ExpenseResponse schema"""
+    return ExpenseResponse.model_construct(
+        id=expense.id,
+        expense_number=expense.expense_number,
+        title=expense.title,
+        description=expense.description,
+        amount=float(expense.amount),
+        category=expense.category.value,
+        status=expense.status.value,
+        vendor_name=expense.vendor_name,
+        vendor_contact=expense.vendor_contact,
+        payment_method=expense.payment_method,
+        payment_reference=expense.payment_reference,
+        expense_date=expense.expense_date,
+        due_date=expense.due_date,
+        payment_date=expense.payment_date,
+        created_by_id=expense.created_by_id,
+        created_by_name=expense.created_by.full_name if expense.created_by else None,
+        approved_by_id=expense.approved_by_id,
+        approved_by_name=expense.approved_by.full_name if expense.approved_by else None,
+        notes=expense.notes,
+        created_at=expense.created_at,
+        updated_at=expense.updated_at
+    )
+
 
 @router.get("/overview", response_model=TransactionListResponse)
 async def get_transaction_overview(
@@ -303,13 +369,17 @@ async def get_transaction_overview(
                 or (t['customer_name'] and search_lower in t['customer_name'].lower())
             ]
         
-        # Calculate summary
-        total_sales = sum(t['amount'] for t in unified_transactions if t['transaction_type'] == 'sale')
-        total_cash_in = sum(t['amount'] for t in unified_transactions if t['transaction_type'] == 'cash_in')
-        total_cash_out = sum(t['amount'] for t in unified_transactions if t['transaction_type'] == 'cash_out')
-        total_expenses = sum(t['amount'] for t in unified_transactions if t['transaction_type'] == 'expense')
-        total_credit_sales = sum(t['amount'] for t in unified_transactions if t['transaction_type'] == 'credit')
-        total_payments = sum(t['amount'] for t in unified_transactions if t['transaction_type'] == 'payment')
+        # Calculate summary in a single pass
+        totals = dict.fromkeys(('sale', 'cash_in', 'cash_out', 'expense', 'credit', 'payment'), 0)
+        for t in unified_transactions:
+            if t['transaction_type'] in totals:
+                totals[t['transaction_type']] += t['amount']
+        total_sales = totals['sale']
+        total_cash_in = totals['cash_in']
+        total_cash_out = totals['cash_out']
+        total_expenses = totals['expense']
+        total_credit_sales = totals['credit']
+        total_payments = totals['payment']
         
         summary = TransactionSummary(
             total_sales=total_sales,
@@ -328,13 +398,16 @@ async def get_transaction_overview(
         end_idx = start_idx + page_size
         paginated_transactions = unified_transactions[start_idx:end_idx]
         
-        return TransactionListResponse(
-            total=total,
-            page=page,
-            page_size=page_size,
-            transactions=paginated_transactions,
-            summary=summary
+        # Rows are built from typed DB values above, so skip re-validating them and
+        # splice the serialized page into the envelope instead of dumping a wrapper model.
+        # FastAPI returns Response objects as-is, without checking them against response_model
+        transactions = [UnifiedTransactionResponse.model_construct(**t) for t in paginated_transactions]
+        content = b'{"total":%d,"page":%d,"page_size":%d,"transactions":%s,"summary":%s}' % (
+            total, page, page_size,
+            _TX_LIST_ADAPTER.dump_json(transactions),
+            summary.model_dump_json().encode()
         )
+        return Response(content=content, media_type="application/json")
     
     except Exception as e:
         logger.error(f"Failed to fetch transaction overview: {e}")
@@ -354,47 +427,59 @@ async def get_transaction_summary(
         start_dt = datetime.fromisoformat(start_date) if start_date else datetime.now() - timedelta(days=30)
         end_dt = datetime.fromisoformat(end_date) if end_date else datetime.now()
         
-        # Calculate totals
-        sales = await Sale.filter(sale_date__gte=start_dt, sale_date__lte=end_dt).all()
-        total_sales = sum(float(s.total_amount) for s in sales)
-        
-        cash_ins = await CashTransaction.filter(
-            transaction_type='cash_in',
-            transaction_date__gte=start_dt,
-            transaction_date__lte=end_dt
-        ).all()
-        total_cash_in = sum(float(c.amount) for c in cash_ins)
-        
-        cash_outs = await CashTransaction.filter(
-            transaction_type='cash_out',
-            transaction_date__gte=start_dt,
-            transaction_date__lte=end_dt
-        ).all()
-        total_cash_out = sum(float(c.amount) for c in cash_outs)
-        
-        expenses = await Expense.filter(
-            expense_date__gte=start_dt,
-            expense_date__lte=end_dt
-        ).all()
-        total_expenses = sum(float(e.amount) for e in expenses)
-        
-        credit_sales = await CustomerTransaction.filter(
-            transaction_type='credit_sale',
-            created_at__gte=start_dt,
-            created_at__lte=end_dt
-        ).all()
-        total_credit_sales = sum(float(c.amount) for c in credit_sales)
-        
-        payments = await CustomerTransaction.filter(
-            transaction_type='payment',
-            created_at__gte=start_dt,
-            created_at__lte=end_dt
-        ).all()
-        total_payments = sum(float(p.amount) for p in payments)
+        # Calculate totals in SQL instead of loading every row
+        total_sales, sales_count = await sum_and_count(
+            Sale.filter(sale_date__gte=start_dt, sale_date__lte=end_dt),
+            'total_amount'
+        )
+        
+        total_cash_in, cash_in_count = await sum_and_count(
+            CashTransaction.filter(
+                transaction_type='cash_in',
+                transaction_date__gte=start_dt,
+                transaction_date__lte=end_dt
+            ),
+            'amount'
+        )
+        
+        total_cash_out, cash_out_count = await sum_and_count(
+            CashTransaction.filter(
+                transaction_type='cash_out',
+                transaction_date__gte=start_dt,
+                transaction_date__lte=end_dt
+            ),
+            'amount'
+        )
+        
+        total_expenses, expense_count = await sum_and_count(
+            Expense.filter(
+                expense_date__gte=start_dt,
+                expense_date__lte=end_dt
+            ),
+            'amount'
+        )
+        
+        total_credit_sales, credit_sale_count = await sum_and_count(
+            CustomerTransaction.filter(
+                transaction_type='credit_sale',
+                created_at__gte=start_dt,
+                created_at__lte=end_dt
+            ),
+            'amount'
+        )
+        
+        total_payments, payment_count = await sum_and_count(
+            CustomerTransaction.filter(
+                transaction_type='payment',
+                created_at__gte=start_dt,
+                created_at__lte=end_dt
+            ),
+            'amount'
+        )
         
         transaction_count = (
-            len(sales) + len(cash_ins) + len(cash_outs) + 
-            len(expenses) + len(credit_sales) + len(payments)
+            sales_count + cash_in_count + cash_out_count +
+            expense_count + credit_sale_count + payment_count
         )
         
         return TransactionSummary(
@@ -422,10 +507,10 @@ async def create_cash_transaction(transaction_data: CashTransactionCreate, user_
     try:
         # Get current cash balance
         last_transaction = await CashTransaction.all().order_by('-transaction_date').first()
-        current_balance = float(last_transaction.balance_after) if last_transaction else Decimal('0.00')
+        current_balance = last_transaction.balance_after if last_transaction else Decimal('0.00')
         
         # Calculate new balance
-        amount = Decimal(str(transaction_data.amount))
+        amount = transaction_data.amount
         if transaction_data.transaction_type == 'cash_in':
             new_balance = current_balance + amount
         else:
@@ -435,8 +520,8 @@ async def create_cash_transaction(transaction_data: CashTransactionCreate, user_
         transaction = await CashTransaction.create(
             transaction_type=transaction_data.transaction_type,
             amount=amount,
-            balance_before=Decimal(str(current_balance)),
-            balance_after=Decimal(str(new_balance)),
+            balance_before=current_balance,
+            balance_after=new_balance,
             category=transaction_data.category,
             description=transaction_data.description,
             reference_number=transaction_data.reference_number,
@@ -482,7 +567,7 @@ async def create_expense(expense_data: ExpenseCreate, user_id: int = 1):
             expense_number=expense_number,
             title=expense_data.title,
             description=expense_data.description,
-            amount=Decimal(str(expense_data.amount)),
+            amount=expense_data.amount,
             category=expense_data.category,
             vendor_name=expense_data.vendor_name,
             vendor_contact=expense_data.vendor_contact,
@@ -497,29 +582,7 @@ async def create_expense(expense_data: ExpenseCreate, user_id: int = 1):
         
         await expense.fetch_related('created_by', 'approved_by')
         
-        return ExpenseResponse(
-            id=expense.id,
-            expense_number=expense.expense_number,
-            title=expense.title,
-            description=expense.description,
-            amount=float(expense.amount),
-            category=expense.category.value,
-            status=expense.status.value,
-            vendor_name=expense.vendor_name,
-            vendor_contact=expense.vendor_contact,
-            payment_method=expense.payment_method,
-            payment_reference=expense.payment_reference,
-            expense_date=expense.expense_date,
-            due_date=expense.due_date,
-            payment_date=expense.payment_date,
-            created_by_id=expense.created_by_id,
-            created_by_name=expense.created_by.full_name if expense.created_by else None,
-            approved_by_id=expense.approved_by_id,
-            approved_by_name=expense.approved_by.full_name if expense.approved_by else None,
-            notes=expense.notes,
-            created_at=expense.created_at,
-            updated_at=expense.updated_at
-        )
+        return expense_to_response(expense)
     
     except Exception as e:
         logger.error(f"Failed to create expense: {e}")
@@ -551,32 +614,10 @@ async def get_expenses(
         
         expenses = await query.prefetch_related('created_by', 'approved_by').order_by('-expense_date')
         
-        return [
-            ExpenseResponse(
-                id=exp.id,
-                expense_number=exp.expense_number,
-                title=exp.title,
-                description=exp.description,
-                amount=float(exp.amount),
-                category=exp.category.value,
-                status=exp.status.value,
-                vendor_name=exp.vendor_name,
-                vendor_contact=exp.vendor_contact,
-                payment_method=exp.payment_method,
-                payment_reference=exp.payment_reference,
-                expense_date=exp.expense_date,
-                due_date=exp.due_date,
-                payment_date=exp.payment_date,
-                created_by_id=exp.created_by_id,
-                created_by_name=exp.created_by.full_name if exp.created_by else None,
-                approved_by_id=exp.approved_by_id,
-                approved_by_name=exp.approved_by.full_name if exp.approved_by else None,
-                notes=exp.notes,
-                created_at=exp.created_at,
-                updated_at=exp.updated_at
-            )
+        return list_json_response(ExpenseResponse, [
+            expense_to_response(exp)
             for exp in expenses
-        ]
+        ])
     
     except Exception as e:
         logger.error(f"Failed to fetch expenses: {e}")
@@ -600,29 +641,7 @@ async def update_expense(expense_id: int, expense_data: ExpenseUpdate):
         await expense.save()
         await expense.fetch_related('created_by', 'approved_by')
         
-        return ExpenseResponse(
-            id=expense.id,
-            expense_number=expense.expense_number,
-            title=expense.title,
-            description=expense.description,
-            amount=float(expense.amount),
-            category=expense.category.value,
-            status=expense.status.value,
-            vendor_name=expense.vendor_name,
-            vendor_contact=expense.vendor_contact,
-            payment_method=expense.payment_method,
-            payment_reference=expense.payment_reference,
-            expense_date=expense.expense_date,
-            due_date=expense.due_date,
-            payment_date=expense.payment_date,
-            created_by_id=expense.created_by_id,
-            created_by_name=expense.created_by.full_name if expense.created_by else None,
-            approved_by_id=expense.approved_by_id,
-            approved_by_name=expense.approved_by.full_name if expense.approved_by else None,
-            notes=expense.notes,
-            created_at=expense.created_at,
-            updated_at=expense.updated_at
-        )
+        return expense_to_response(expense)
     
     except DoesNotExist:
         raise HTTPException(
@@ -664,31 +683,10 @@ async def get_sales(
         
         sales = await query.prefetch_related('sold_by', 'customer', 'session').order_by('-sale_date').offset(skip).limit(limit)
         
-        return [
-            SaleResponse(
-                id=sale.id,
-                invoice_number=sale.invoice_number,
-                session_id=sale.session_id,
-                customer_id=sale.customer_id,
-                customer_name=sale.customer.name if sale.customer else None,
-                subtotal=float(sale.subtotal),
-                tax_amount=float(sale.tax_amount),
-                discount_amount=float(sale.discount_amount),
-                total_amount=float(sale.total_amount),
-                payment_method=sale.payment_method.value,
-                amount_paid=float(sale.amount_paid),
-                change_given=float(sale.change_given),
-                status=sale.status.value,
-                notes=sale.notes,
-                items=sale.items,
-                sold_by_id=sale.sold_by_id,
-                sold_by_name=sale.sold_by.full_name if sale.sold_by else None,
-                sale_date=sale.sale_date,
-                created_at=sale.created_at,
-                updated_at=sale.updated_at
-            )
+        return list_json_response(SaleResponse, [
+            sale_to_response(sale)
             for sale in sales
-        ]
+        ])
     
     except Exception as e:
         logger.error(f"Failed to fetch sales: {e}")
@@ -704,28 +702,7 @@ async def get_sale(sale_id: int):
     try:
         sale = await Sale.get(id=sale_id).prefetch_related('sold_by', 'customer', 'session')
         
-        return SaleResponse(
-            id=sale.id,
-            invoice_number=sale.invoice_number,
-            session_id=sale.session_id,
-            customer_id=sale.customer_id,
-            customer_name=sale.customer.name if sale.customer else None,
-            subtotal=float(sale.subtotal),
-            tax_amount=float(sale.tax_amount),
-            discount_amount=float(sale.discount_amount),
-            total_amount=float(sale.total_amount),
-            payment_method=sale.payment_method.value,
-            amount_paid=float(sale.amount_paid),
-            change_given=float(sale.change_given),
-            status=sale.status.value,
-            notes=sale.notes,
-            items=sale.items,
-            sold_by_id=sale.sold_by_id,
-            sold_by_name=sale.sold_by.full_name if sale.sold_by else None,
-            sale_date=sale.sale_date,
-            created_at=sale.created_at,
-            updated_at=sale.updated_at
-        )
+        return sale_to_response(sale)
     
     except DoesNotExist:
         raise HTTPException(
@@ -746,28 +723,7 @@ async def get_sale_by_invoice(invoice_number: str):
     try:
         sale = await Sale.get(invoice_number=invoice_number).prefetch_related('sold_by', 'customer', 'session')
         
-        return SaleResponse(
-            id=sale.id,
-            invoice_number=sale.invoice_number,
-            session_id=sale.session_id,
-            customer_id=sale.customer_id,
-            customer_name=sale.customer.name if sale.customer else None,
-            subtotal=float(sale.subtotal),
-            tax_amount=float(sale.tax_amount),
-            discount_amount=float(sale.discount_amount),
-            total_amount=float(sale.total_amount),
-            payment_method=sale.payment_method.value,
-            amount_paid=float(sale.amount_paid),
-            change_given=float(sale.change_given),
-            status=sale.status.value,
-            notes=sale.notes,
-            items=sale.items,
-            sold_by_id=sale.sold_by_id,
-            sold_by_name=sale.sold_by.full_name if sale.sold_by else None,
-            sale_date=sale.sale_date,
-            created_at=sale.created_at,
-            updated_at=sale.updated_at
-        )
+        return sale_to_response(sale)
     
     except DoesNotExist:
         raise HTTPException(
@@ -31,6 +31,8 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = 5
     DB_MAX_OVERFLOW: int = 10
     DB_POOL_TIMEOUT: int = 30
+    # SQLite fsync level; NORMAL is crash-safe under WAL, FULL also survives power loss
+    DB_SYNCHRONOUS: str = "NORMAL"
 
     @property
     def database_path(self) -> Path:
@@ -3,6 +3,8 @@ Tortoise ORM configuration for SQLite database
 """
 from pathlib import Path
 
+from ..config import settings
+
 # Get the project root directory
 BASE_DIR = Path(__file__).resolve().parent.parent.parent
 
@@ -23,6 +25,10 @@ TORTOISE_ORM = {
                 "journal_mode": "WAL",  # Write-Ahead Logging for better concurrency
                 "journal_size_limit": 16384,  # 16KB journal size limit
                 "foreign_keys": "ON",  # Enforce referential integrity
+                "synchronous": settings.DB_SYNCHRONOUS,  # Fewer fsyncs per commit under WAL
+                "busy_timeout": 5000,  # Wait up to 5s on locks (e.g. backup reads) instead of failing
+                "temp_store": "MEMORY",  # Keep temp tables/indices for sorts in memory
+                "cache_size": -65536,  # 64MB page cache (negative = KiB)
             }
         }
     },
@@ -4,10 +4,10 @@ Setting model for normalized application configuration storage.
 This model replaces the JSON-based Settings model with a normalized
 relational structure where each setting is stored as an individual row.
 """
-import json
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from tortoise import fields
+import orjson
+from tortoise import fields, timezone
 from tortoise.exceptions import DoesNotExist
 from .base import BaseModel
 
@@ -20,6 +20,31 @@ class SettingDataType(str, Enum):
     JSON = "json"
 
 
+def _decode_boolean(value: str) -> bool:
+    return value.lower() in ('true', '1', 'yes', 'on')
+
+
+def _decode_number(value: str) -> Any:
+    # Try int first, then float
+    try:
+        return int(value)
+    except ValueError:
+        return float(value)
+
+
+def _decode_string(value: str) -> str:
+    return value
+
+
+# Stored string -> typed value, keyed by data_type
+VALUE_DECODERS = {
+    SettingDataType.STRING: _decode_string,
+    SettingDataType.NUMBER: _decode_number,
+    SettingDataType.BOOLEAN: _decode_boolean,
+    SettingDataType.JSON: orjson.loads,
+}
+
+
 class Setting(BaseModel):
     """
     Normalized setting model for storing individual configuration values.
@@ -91,18 +116,7 @@ class Setting(BaseModel):
         Returns:
             The value converted to the appropriate Python type
         """
-        if self.data_type == SettingDataType.BOOLEAN:
-            return self.value.lower() in ('true', '1', 'yes', 'on')
-        elif self.data_type == SettingDataType.NUMBER:
-            # Try int first, then float
-            try:
-                return int(self.value)
-            except ValueError:
-                return float(self.value)
-        elif self.data_type == SettingDataType.JSON:
-            return json.loads(self.value)
-        else:  # STRING
-            return self.value
+        return VALUE_DECODERS[self.data_type](self.value)
     
     def get_typed_default(self) -> Any:
         """
@@ -111,17 +125,7 @@ class Setting(BaseModel):
         Returns:
             The default value converted to the appropriate Python type
         """
-        if self.data_type == SettingDataType.BOOLEAN:
-            return self.default_value.lower() in ('true', '1', 'yes', 'on')
-        elif self.data_type == SettingDataType.NUMBER:
-            try:
-                return int(self.default_value)
-            except ValueError:
-                return float(self.default_value)
-        elif self.data_type == SettingDataType.JSON:
-            return json.loads(self.default_value)
-        else:  # STRING
-            return self.default_value
+        return VALUE_DECODERS[self.data_type](self.default_value)
     
     @staticmethod
     def value_to_string(value: Any, data_type: SettingDataType) -> str:
@@ -138,7 +142,7 @@ class Setting(BaseModel):
         if data_type == SettingDataType.BOOLEAN:
             return 'true' if value else 'false'
         elif data_type == SettingDataType.JSON:
-            return json.dumps(value)
+            return orjson.dumps(value).decode()
         else:
             return str(value)
     
@@ -208,20 +212,17 @@ class Setting(BaseModel):
         Returns:
             List of updated Setting instances
         """
-        updated = []
-        for key, value in settings_dict.items():
-            try:
-                setting = await cls.update_setting(section, key, value)
-                updated.append(setting)
-            except DoesNotExist:
-                # Skip settings that don't exist
-                continue
-        return updated
+        return await cls.bulk_update(
+            [{'section': section, 'key': key, 'value': value} for key, value in settings_dict.items()]
+        )
     
     @classmethod
     async def bulk_update(cls, updates: List[Dict[str, Any]]) -> List['Setting']:
         """
         Bulk update multiple settings across sections.
+
+        Loads the affected rows in one SELECT and writes them back in a single
+        UPDATE; entries that are malformed or name a missing setting are skipped.
         
         Args:
             updates: List of dicts with 'section', 'key', and 'value' keys
@@ -229,17 +230,31 @@ class Setting(BaseModel):
         Returns:
             List of updated Setting instances
         """
-        updated = []
+        values = {}
         for update in updates:
             try:
-                setting = await cls.update_setting(
-                    update['section'],
-                    update['key'],
-                    update['value']
-                )
-                updated.append(setting)
-            except (DoesNotExist, KeyError):
+                values[(update['section'], update['key'])] = update['value']
+            except KeyError:
                 continue
+        if not values:
+            return []
+
+        # section__in/key__in may over-select; rows are matched on the exact pair below
+        candidates = await cls.filter(
+            section__in={section for section, _ in values},
+            key__in={key for _, key in values}
+        )
+        now = timezone.now()
+        updated = []
+        for setting in candidates:
+            pair = (setting.section, setting.key)
+            if pair in values:
+                setting.value = cls.value_to_string(values[pair], setting.data_type)
+                setting.updated_at = now
+                updated.append(setting)
+
+        if updated:
+            await super().bulk_update(updated, fields=['value', 'updated_at'])
         return updated
     
     @classmethod
@@ -1,13 +1,27 @@
 """
 Main FastAPI application entry point for POS backend
 """
+import asyncio
 import logging
 from contextlib import asynccontextmanager
+
+# Fail fast with a packaging hint if the bundle is missing pydantic-core's compiled
+# extension; this must run before fastapi imports pydantic
+try:
+    import pydantic_core
+except ImportError as e:
+    raise ImportError(
+        "pydantic-core Rust extension (pydantic_core._pydantic_core) could not be loaded; "
+        "make sure server.spec lists it in hiddenimports"
+    ) from e
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from .api import router as api_router
 from .api.jsonrpc import jsonrpc_exception_handler
+from .api.schemas import warm_deferred_schemas
 from .config import settings
 from .database import init_db, close_db, get_db_info
 
@@ -44,6 +58,9 @@ async def lifespan(_app: FastAPI):
         logger.error("Failed to initialize database: %s", e)
         raise
 
+    # Build deferred schemas right after startup instead of on the first request
+    asyncio.get_running_loop().call_soon(warm_deferred_schemas)
+
     yield
 
     # Shutdown
@@ -60,6 +77,7 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
     description="POS Application Backend API",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -59,6 +59,8 @@ class BackupManager:
     DEFAULT_BACKUP_DIR = Path("backups")
     METADATA_FILE = "backup_manifest.json"
     COMPRESSION_LEVEL = 6
+    # Chunk size for streaming copies and checksums; shutil/hashlib defaults are 64KB/4KB
+    COPY_BUFFER_SIZE = 1024 * 1024
     
     def __init__(self, database_path: Path, backup_dir: Optional[Path] = None):
         """
@@ -77,7 +79,7 @@ class BackupManager:
         """Calculate SHA256 checksum of a file"""
         sha256_hash = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
+            for byte_block in iter(lambda: f.read(self.COPY_BUFFER_SIZE), b""):
                 sha256_hash.update(byte_block)
         return sha256_hash.hexdigest()
     
@@ -273,7 +275,7 @@ class BackupManager:
         
         with open(source_path, 'rb') as f_in:
             with gzip.open(compressed_path, 'wb', compresslevel=self.COMPRESSION_LEVEL) as f_out:
-                shutil.copyfileobj(f_in, f_out)
+                shutil.copyfileobj(f_in, f_out, self.COPY_BUFFER_SIZE)
         
         return compressed_path
     
@@ -281,7 +283,7 @@ class BackupManager:
         """Decompress a gzip backup file"""
         with gzip.open(compressed_path, 'rb') as f_in:
             with open(output_path, 'wb') as f_out:
-                shutil.copyfileobj(f_in, f_out)
+                shutil.copyfileobj(f_in, f_out, self.COPY_BUFFER_SIZE)
     
     def _backup_selected_tables(
         self,
@@ -454,6 +456,8 @@ class BackupManager:
     def list_backups(self) -> List[Dict[str, Any]]:
         """List all available backups with metadata"""
         backups = []
+        # One manifest read for the whole listing instead of one per backup file
+        metadata_index = self._load_metadata_index()
         
         # Find all backup files
         for backup_file in sorted(self.backup_dir.glob("pos_backup_*.db*")):
@@ -463,7 +467,7 @@ class BackupManager:
                 size_mb = stat_info.st_size / (1024 * 1024)
                 
                 # Try to load metadata
-                metadata = self.get_backup_metadata(backup_file.name)
+                metadata = metadata_index.get(backup_file.name)
                 
                 backup_info = {
                     "filename": backup_file.name,
@@ -577,25 +581,29 @@ class BackupManager:
         except Exception as e:
             logger.warning(f"Failed to save backup metadata: {e}")
     
-    def get_backup_metadata(self, filename: str) -> Optional[Dict[str, Any]]:
-        """Get metadata for a specific backup"""
+    def _load_metadata_index(self) -> Dict[str, Dict[str, Any]]:
+        """Read the manifest once and index its entries by filename (first entry wins)"""
         manifest_path = self.backup_dir / self.METADATA_FILE
+        index: Dict[str, Dict[str, Any]] = {}
         
         if not manifest_path.exists():
-            return None
+            return index
         
         try:
             with open(manifest_path, 'r') as f:
                 manifest = json.load(f)
             
             for metadata in manifest:
-                if metadata['filename'] == filename:
-                    return metadata
+                index.setdefault(metadata['filename'], metadata)
                     
         except Exception as e:
             logger.warning(f"Failed to read backup metadata: {e}")
         
-        return None
+        return index
+    
+    def get_backup_metadata(self, filename: str) -> Optional[Dict[str, Any]]:
+        """Get metadata for a specific backup"""
+        return self._load_metadata_index().get(filename)
     
     def verify_backup(self, filename: str) -> Dict[str, Any]:
         """Verify integrity of a backup file"""
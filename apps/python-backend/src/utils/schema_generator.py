@@ -65,7 +65,7 @@ class SchemaGenerator:
             "from datetime import datetime",
             "from decimal import Decimal",
             "from typing import Optional, Any, Dict, List",
-            "from pydantic import BaseModel, Field, field_validator",
+            "from pydantic import BaseModel, ConfigDict, Field, field_validator",
         }
         
     def get_python_type(self, field: fields.Field) -> str:
@@ -298,6 +298,8 @@ class SchemaGenerator:
         lines = [
             f"class {schema_name}(BaseModel):",
             f'    """Schema for {model_name.lower()} response"""',
+            "    model_config = ConfigDict(from_attributes=True)",
+            "",
         ]
         
         # Get all fields including auto-generated ones
@@ -312,13 +314,6 @@ class SchemaGenerator:
             )
             lines.append(field_def)
             
-        # Add Config class
-        lines.extend([
-            "",
-            "    class Config:",
-            "        from_attributes = True",
-        ])
-            
         return "\n".join(lines)
     
     def generate_enum_definitions(self, model: Type[Model]) -> List[str]: